@@ -3,21 +3,39 @@ Database models and helpers for the Interview Prep application.
 Stores problem attempts, bookmarks, study plans, and analytics data.
 """
 
-import json
 import os
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
+import pydantic_core
 from sqlalchemy import (
+    JSON,
     Column,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
+    bindparam,
     create_engine,
+    event,
+    func,
+    insert,
+    inspect,
+    text,
+    update,
+)
+from sqlalchemy.orm import (
+    Session,
+    declarative_base,
+    load_only,
+    relationship,
+    sessionmaker,
 )
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 Base = declarative_base()
 
@@ -26,9 +44,21 @@ class ProblemAttempt(Base):
     """Stores each problem attempt with structured data for history/analytics."""
 
     __tablename__ = "problem_attempts"
+    # Composite indexes lead with user_id, so no separate user_id index needed.
+    __table_args__ = (
+        Index("ix_attempts_user_created", "user_id", "created_at"),
+        Index("ix_attempts_user_verdict", "user_id", "verdict"),
+        # Partial: attempts without a scheduled review are left out.
+        Index(
+            "ix_attempts_due",
+            "user_id",
+            "next_review_at",
+            sqlite_where=text("next_review_at IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(255), nullable=False, index=True)
+    user_id = Column(String(255), nullable=False)
     created_at = Column(
         DateTime, default=lambda: datetime.now(timezone.utc), index=True
     )
@@ -36,7 +66,7 @@ class ProblemAttempt(Base):
     # Problem metadata
     title = Column(String(500), nullable=False)
     difficulty = Column(String(50), nullable=False)  # Easy, Medium, Hard
-    patterns = Column(Text)  # JSON array of patterns
+    patterns = Column(JSON(none_as_null=True))  # list of pattern names
     statement = Column(Text)
 
     # Attempt details
@@ -65,10 +95,10 @@ class ProblemAttempt(Base):
         return {
             "id": self.id,
             "userId": self.user_id,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
+            "createdAt": self.created_at,
             "title": self.title,
             "difficulty": self.difficulty,
-            "patterns": json.loads(self.patterns) if self.patterns else [],  # type: ignore[arg-type]
+            "patterns": self.patterns or [],
             "statement": self.statement,
             "language": self.language,
             "code": self.code,
@@ -77,45 +107,109 @@ class ProblemAttempt(Base):
             "timeComplexity": self.time_complexity,
             "spaceComplexity": self.space_complexity,
             "evaluationMarkdown": self.evaluation_markdown,
-            "nextReviewAt": self.next_review_at.isoformat()
-            if self.next_review_at
-            else None,
+            "nextReviewAt": self.next_review_at,
             "reviewIntervalDays": self.review_interval_days,
             "companyStyle": self.company_style,
             "mockSessionId": self.mock_session_id,
         }
 
+    def to_list_dict(self) -> dict:
+        """Slim payload for list views (no code/statement/evaluation bodies)."""
+        return {
+            "id": self.id,
+            "createdAt": self.created_at,
+            "title": self.title,
+            "difficulty": self.difficulty,
+            "patterns": self.patterns or [],
+            "language": self.language,
+            "hintsUsed": self.hints_used,
+            "verdict": self.verdict,
+            "nextReviewAt": self.next_review_at,
+            "companyStyle": self.company_style,
+        }
+
+
+# Columns read by ProblemAttempt.to_list_dict, for use with load_only().
+ATTEMPT_LIST_COLUMNS = (
+    ProblemAttempt.id,
+    ProblemAttempt.created_at,
+    ProblemAttempt.title,
+    ProblemAttempt.difficulty,
+    ProblemAttempt.patterns,
+    ProblemAttempt.language,
+    ProblemAttempt.hints_used,
+    ProblemAttempt.verdict,
+    ProblemAttempt.next_review_at,
+    ProblemAttempt.company_style,
+)
+
 
 class Bookmark(Base):
     """Stores bookmarked problems in collections."""
 
     __tablename__ = "bookmarks"
+    __table_args__ = (
+        Index(
+            "ix_bookmarks_user_attempt_collection",
+            "user_id",
+            "attempt_id",
+            "collection_name",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(255), nullable=False, index=True)
+    user_id = Column(String(255), nullable=False)
     attempt_id = Column(Integer, ForeignKey("problem_attempts.id"), nullable=False)
     collection_name = Column(String(255), default="Saved")
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     notes = Column(Text, nullable=True)
 
-    def to_dict(self) -> dict:
-        return {
+    # lazy="raise" so an accidental per-row lazy load (N+1) fails loudly;
+    # load it explicitly with selectinload().
+    attempt = relationship("ProblemAttempt", lazy="raise")
+
+    def to_dict(self, include_attempt: bool = False) -> dict:
+        data = {
             "id": self.id,
             "userId": self.user_id,
             "attemptId": self.attempt_id,
             "collectionName": self.collection_name,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
+            "createdAt": self.created_at,
             "notes": self.notes,
         }
+        if include_attempt:
+            data["attempt"] = (
+                {
+                    "id": self.attempt.id,
+                    "title": self.attempt.title,
+                    "difficulty": self.attempt.difficulty,
+                }
+                if self.attempt
+                else None
+            )
+        return data
+
+
+class BookmarkCollection(Base):
+    """Distinct bookmark collection names per user, maintained on insert."""
+
+    __tablename__ = "bookmark_collections"
+    __table_args__ = (UniqueConstraint("user_id", "name"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(255), nullable=False)
+    name = Column(String(255), nullable=False)
 
 
 class MockInterviewSession(Base):
     """Stores mock interview sessions."""
 
     __tablename__ = "mock_interview_sessions"
+    __table_args__ = (Index("ix_mock_sessions_user_created", "user_id", "created_at"),)
 
     id = Column(String(100), primary_key=True)
-    user_id = Column(String(255), nullable=False, index=True)
+    user_id = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     completed_at = Column(DateTime, nullable=True)
 
@@ -123,22 +217,35 @@ class MockInterviewSession(Base):
     session_type = Column(String(50))  # phone_screen, onsite, custom
     time_limit_minutes = Column(Integer, default=45)
     num_problems = Column(Integer, default=2)
-    difficulties = Column(Text)  # JSON array
+    difficulties = Column(JSON(none_as_null=True))  # list of difficulty labels
 
-    # Results
+    # Results. problems_completed and score_sum are bumped by create_attempt()
+    # as tagged attempts arrive; total_score stays NULL until completion.
     problems_completed = Column(Integer, default=0)
+    score_sum = Column(Integer, nullable=False, default=0, server_default="0")
     total_score = Column(Float, nullable=True)
 
+    # Attempts tagged with this session (mock_session_id is not a real FK).
+    # lazy="raise": load explicitly with joinedload()/selectinload().
+    problems = relationship(
+        "ProblemAttempt",
+        primaryjoin=(
+            "foreign(ProblemAttempt.mock_session_id) == MockInterviewSession.id"
+        ),
+        lazy="raise",
+        viewonly=True,
+    )
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
             "userId": self.user_id,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
-            "completedAt": self.completed_at.isoformat() if self.completed_at else None,
+            "createdAt": self.created_at,
+            "completedAt": self.completed_at,
             "sessionType": self.session_type,
             "timeLimitMinutes": self.time_limit_minutes,
             "numProblems": self.num_problems,
-            "difficulties": json.loads(self.difficulties) if self.difficulties else [],  # type: ignore[arg-type]
+            "difficulties": self.difficulties or [],
             "problemsCompleted": self.problems_completed,
             "totalScore": self.total_score,
         }
@@ -155,7 +262,7 @@ class StudyPlan(Base):
 
     # Plan content
     week_number = Column(Integer, default=1)
-    focus_patterns = Column(Text)  # JSON array
+    focus_patterns = Column(JSON(none_as_null=True))  # list of pattern names
     daily_goal = Column(Integer, default=3)
     difficulty_focus = Column(String(50))
     plan_markdown = Column(Text)
@@ -164,71 +271,263 @@ class StudyPlan(Base):
         return {
             "id": self.id,
             "userId": self.user_id,
-            "createdAt": self.created_at.isoformat() if self.created_at else None,
+            "createdAt": self.created_at,
             "weekNumber": self.week_number,
-            "focusPatterns": json.loads(self.focus_patterns)  # type: ignore[arg-type]
-            if self.focus_patterns
-            else [],
+            "focusPatterns": self.focus_patterns or [],
             "dailyGoal": self.daily_goal,
             "difficultyFocus": self.difficulty_focus,
             "planMarkdown": self.plan_markdown,
         }
 
 
-def get_engine():
-    """Get SQLAlchemy engine for the interview prep database."""
-    db_path = (
+def _get_db_path() -> str:
+    return (
         os.getenv("INTERVIEW_SQLITE_PATH")
         or os.getenv("SQLITE_DB_PATH")
         or "./memori_interview.sqlite"
     )
+
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune each new pooled connection: WAL lets readers proceed during writes."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _json_dumps(value) -> str:
+    """Serialize JSON columns with pydantic-core's Rust encoder."""
+    return pydantic_core.to_json(value).decode()
+
+
+@lru_cache(maxsize=1)
+def _create_engine(db_path: str):
+    """Build the engine once per DB path so every session shares its pool."""
     database_url = f"sqlite:///{db_path}"
-    return create_engine(
+    # pool_size + max_overflow matches FastAPI's 40-thread sync pool, so sync
+    # endpoints don't queue on the pool; pool_pre_ping discards dead
+    # connections before handing them out, pool_recycle retires old ones.
+    engine = create_engine(
         database_url,
         pool_pre_ping=True,
+        pool_size=20,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=1800,
         connect_args={"check_same_thread": False},
+        json_serializer=_json_dumps,
+        json_deserializer=pydantic_core.from_json,
     )
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def get_engine():
+    """Get SQLAlchemy engine for the interview prep database."""
+    return _create_engine(_get_db_path())
+
+
+# expire_on_commit=False so reading e.g. `attempt.id` after commit doesn't
+# trigger a reload SELECT.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
 
 
 def get_session() -> Session:
     """Get a new database session."""
-    engine = get_engine()
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return SessionLocal()
+    return SessionLocal(bind=get_engine())
+
+
+def db_session() -> Iterator[Session]:
+    """FastAPI dependency yielding one session per request, always closed."""
+    db = get_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Seeds bookmark_collections from bookmarks that predate the table.
+_BACKFILL_BOOKMARK_COLLECTIONS = text(
+    """
+    INSERT OR IGNORE INTO bookmark_collections (user_id, name)
+    SELECT DISTINCT user_id, collection_name
+    FROM bookmarks
+    WHERE collection_name IS NOT NULL
+    """
+)
+
+
+# Before the unique bookmark index existed, concurrent adds could store the
+# same (user, attempt, collection) twice; keep the oldest row of each.
+_DEDUPE_BOOKMARKS = text(
+    """
+    DELETE FROM bookmarks
+    WHERE id NOT IN (
+        SELECT MIN(id)
+        FROM bookmarks
+        GROUP BY user_id, attempt_id, collection_name
+    )
+    """
+)
+
+
+# One-off for databases created before mock_interview_sessions.score_sum.
+_ADD_MOCK_SCORE_SUM = text(
+    """
+    ALTER TABLE mock_interview_sessions
+    ADD COLUMN score_sum INTEGER NOT NULL DEFAULT 0
+    """
+)
+
+# Seeds the running mock-session aggregates from already tagged attempts.
+_BACKFILL_MOCK_AGGREGATES = text(
+    """
+    UPDATE mock_interview_sessions
+    SET problems_completed = agg.n, score_sum = agg.points
+    FROM (
+        SELECT
+            mock_session_id,
+            COUNT(*) AS n,
+            SUM(
+                CASE verdict
+                    WHEN 'correct' THEN 100
+                    WHEN 'partially_correct' THEN 50
+                    ELSE 0
+                END
+            ) AS points
+        FROM problem_attempts
+        WHERE mock_session_id IS NOT NULL
+        GROUP BY mock_session_id
+    ) AS agg
+    WHERE mock_interview_sessions.id = agg.mock_session_id
+    """
+)
 
 
 def init_database():
     """Initialize database tables."""
     engine = get_engine()
     Base.metadata.create_all(bind=engine)
+    bookmark_indexes = {ix["name"] for ix in inspect(engine).get_indexes("bookmarks")}
+    if "ix_bookmarks_user_attempt_collection" not in bookmark_indexes:
+        with engine.begin() as conn:
+            conn.execute(_DEDUPE_BOOKMARKS)
+    # create_all skips tables that already exist, so add any indexes declared
+    # after a database was first created.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    mock_columns = {
+        c["name"] for c in inspect(engine).get_columns("mock_interview_sessions")
+    }
+    with engine.begin() as conn:
+        conn.execute(_BACKFILL_BOOKMARK_COLLECTIONS)
+        if "score_sum" not in mock_columns:
+            conn.execute(_ADD_MOCK_SCORE_SUM)
+            conn.execute(_BACKFILL_MOCK_AGGREGATES)
 
 
 # Spaced Repetition helpers
-def calculate_next_review(attempt: ProblemAttempt, was_correct: bool) -> datetime:
+def sm2_next(interval: int, ease: float, correct: bool) -> tuple[int, float, datetime]:
     """
-    Calculate next review date using SM-2 algorithm variant.
+    Pure SM-2 step: return (interval_days, ease_factor, next_review_at).
     """
-    if was_correct:
-        new_interval = int(attempt.review_interval_days * attempt.ease_factor)  # type: ignore[arg-type]
-        new_ease = min(2.5, attempt.ease_factor + 0.1)
+    if correct:
+        new_interval = int(interval * ease)
+        new_ease = min(2.5, ease + 0.1)
     else:
         new_interval = 1  # Reset to 1 day
-        new_ease = max(1.3, attempt.ease_factor - 0.2)
+        new_ease = max(1.3, ease - 0.2)
+
+    next_review_at = datetime.now(timezone.utc) + timedelta(days=new_interval)
+    return new_interval, new_ease, next_review_at
+
+
+def calculate_next_review(attempt: ProblemAttempt, was_correct: bool) -> datetime:
+    """
+    Calculate next review date using SM-2 algorithm variant.
 
-    attempt.review_interval_days = new_interval
-    attempt.ease_factor = new_ease
-    attempt.next_review_at = datetime.now(timezone.utc) + timedelta(days=new_interval)
+    Mutates an existing attempt's schedule in place; new attempts get their
+    first schedule from sm2_next() at insert time (see create_attempt).
+    """
+    interval, ease, next_review_at = sm2_next(
+        attempt.review_interval_days,  # type: ignore[arg-type]
+        attempt.ease_factor,  # type: ignore[arg-type]
+        was_correct,
+    )
+    attempt.review_interval_days = interval
+    attempt.ease_factor = ease
+    attempt.next_review_at = next_review_at
 
     return attempt.next_review_at
 
 
+# Points per verdict when scoring mock sessions; averaged on completion.
+MOCK_VERDICT_POINTS = {"correct": 100, "partially_correct": 50}
+
+
+def create_attempt(db: Session, was_correct: bool, **fields) -> int:
+    """
+    Insert a new attempt with its first review already scheduled and return
+    its id. Uses INSERT ... RETURNING, so no follow-up refresh/UPDATE is needed.
+
+    Attempts tagged with a mock session also bump that session's running
+    problems_completed/score_sum, so completing it needs no rescan.
+    """
+    interval, ease, next_review_at = sm2_next(1, 2.5, was_correct)
+    stmt = (
+        insert(ProblemAttempt)
+        .values(
+            **fields,
+            review_interval_days=interval,
+            ease_factor=ease,
+            next_review_at=next_review_at,
+        )
+        .returning(ProblemAttempt.id)
+    )
+    attempt_id = db.execute(stmt).scalar_one()
+
+    if fields.get("mock_session_id"):
+        db.execute(
+            update(MockInterviewSession)
+            .where(MockInterviewSession.id == fields["mock_session_id"])
+            .values(
+                problems_completed=func.coalesce(
+                    MockInterviewSession.problems_completed, 0
+                )
+                + 1,
+                score_sum=MockInterviewSession.score_sum
+                + MOCK_VERDICT_POINTS.get(fields.get("verdict"), 0),
+            )
+        )
+    return attempt_id
+
+
 def get_due_problems(
     db: Session, user_id: str, limit: int = 10
 ) -> list[ProblemAttempt]:
-    """Get problems due for review (spaced repetition)."""
+    """
+    Get problems due for review (spaced repetition).
+
+    Only ATTEMPT_LIST_COLUMNS are loaded; serialize with to_list_dict().
+    """
     now = datetime.now(timezone.utc)
     return (
         db.query(ProblemAttempt)
+        .options(load_only(*ATTEMPT_LIST_COLUMNS))
         .filter(
             ProblemAttempt.user_id == user_id,
             ProblemAttempt.next_review_at <= now,
@@ -239,86 +538,264 @@ def get_due_problems(
     )
 
 
+def find_current_week_plan(
+    db: Session, user_id: str, focus_patterns: list[str]
+) -> StudyPlan | None:
+    """
+    Get the latest plan generated this week for the same focus patterns.
+
+    Weeks start Monday 00:00 UTC, matching the weekly activity buckets.
+    """
+    now = datetime.now(timezone.utc)
+    week_start = (now - timedelta(days=now.weekday())).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    plans = (
+        db.query(StudyPlan)
+        .filter(StudyPlan.user_id == user_id, StudyPlan.created_at >= week_start)
+        .order_by(StudyPlan.created_at.desc())
+    )
+    return next((p for p in plans if p.focus_patterns == focus_patterns), None)
+
+
 # Analytics helpers
-def get_pattern_stats(db: Session, user_id: str) -> dict[str, dict]:
-    """Get statistics by pattern for a user."""
-    attempts = db.query(ProblemAttempt).filter(ProblemAttempt.user_id == user_id).all()
+_PATTERN_VERDICT_COUNTS = text(
+    """
+    SELECT je.value AS pattern, pa.verdict AS verdict, COUNT(*) AS n
+    FROM problem_attempts AS pa, json_each(pa.patterns) AS je
+    WHERE pa.user_id = :user_id
+    GROUP BY je.value, pa.verdict
+    """
+)
 
+
+def _pivot_pattern_counts(rows) -> dict[str, dict]:
+    """Fold (pattern, verdict, count) rows into per-pattern verdict tallies."""
     pattern_stats: dict[str, dict] = {}
 
-    for attempt in attempts:
-        patterns = json.loads(attempt.patterns) if attempt.patterns else []  # type: ignore[arg-type]
-        for pattern in patterns:
-            if pattern not in pattern_stats:
-                pattern_stats[pattern] = {
-                    "total": 0,
-                    "correct": 0,
-                    "incorrect": 0,
-                    "partial": 0,
-                }
-            pattern_stats[pattern]["total"] += 1
-            if attempt.verdict == "correct":
-                pattern_stats[pattern]["correct"] += 1
-            elif attempt.verdict == "incorrect":
-                pattern_stats[pattern]["incorrect"] += 1
-            else:
-                pattern_stats[pattern]["partial"] += 1
+    for pattern, verdict, n in rows:
+        if pattern not in pattern_stats:
+            pattern_stats[pattern] = {
+                "total": 0,
+                "correct": 0,
+                "incorrect": 0,
+                "partial": 0,
+            }
+        pattern_stats[pattern]["total"] += n
+        if verdict == "correct":
+            pattern_stats[pattern]["correct"] += n
+        elif verdict == "incorrect":
+            pattern_stats[pattern]["incorrect"] += n
+        else:
+            pattern_stats[pattern]["partial"] += n
 
     return pattern_stats
 
 
-def get_difficulty_stats(db: Session, user_id: str) -> dict[str, dict]:
-    """Get statistics by difficulty for a user."""
-    attempts = db.query(ProblemAttempt).filter(ProblemAttempt.user_id == user_id).all()
-
+def _pivot_difficulty_counts(rows) -> dict[str, dict]:
+    """Fold (difficulty, verdict, count) rows into per-difficulty tallies."""
     stats = {
         "Easy": {"total": 0, "correct": 0},
         "Medium": {"total": 0, "correct": 0},
         "Hard": {"total": 0, "correct": 0},
     }
 
-    for attempt in attempts:
-        diff = attempt.difficulty
+    for diff, verdict, n in rows:
         if diff in stats:
-            stats[diff]["total"] += 1
-            if attempt.verdict == "correct":
-                stats[diff]["correct"] += 1
+            stats[diff]["total"] += n
+            if verdict == "correct":
+                stats[diff]["correct"] += n
 
     return stats
 
 
+def _fill_weeks(
+    weekly_data: dict[str, int], start_date: datetime, end_date: datetime
+) -> list[dict]:
+    """Expand Monday-keyed counts into one entry per week, zero-filling gaps."""
+    result = []
+    current = start_date - timedelta(days=start_date.weekday())
+    while current <= end_date:
+        week_key = current.strftime("%Y-%m-%d")
+        result.append(
+            {
+                "week": week_key,
+                "count": weekly_data.get(week_key, 0),
+            }
+        )
+        current += timedelta(weeks=1)
+
+    return result
+
+
+def get_attempt_counts(db: Session, user_id: str) -> tuple[int, int]:
+    """Get (total, correct) attempt counts for a user in one query."""
+    total, correct = (
+        db.query(
+            func.count(),
+            func.count().filter(ProblemAttempt.verdict == "correct"),
+        )
+        .filter(ProblemAttempt.user_id == user_id)
+        .one()
+    )
+    return total, correct
+
+
+def get_attempts_version(db: Session, user_id: str) -> tuple:
+    """
+    Cheap change marker for a user's attempts: (count, latest created_at).
+
+    Answered from the (user_id, created_at) index alone.
+    """
+    return tuple(
+        db.query(func.count(), func.max(ProblemAttempt.created_at))
+        .filter(ProblemAttempt.user_id == user_id)
+        .one()
+    )
+
+
+def get_mock_sessions_version(db: Session, user_id: str) -> tuple:
+    """
+    Cheap change marker for a user's mock sessions: moves when a session is
+    started, gets a new attempt, or is completed.
+    """
+    return tuple(
+        db.query(
+            func.count(),
+            func.max(MockInterviewSession.created_at),
+            func.max(MockInterviewSession.completed_at),
+            func.sum(MockInterviewSession.problems_completed),
+        )
+        .filter(MockInterviewSession.user_id == user_id)
+        .one()
+    )
+
+
+def get_pattern_stats(db: Session, user_id: str) -> dict[str, dict]:
+    """Get statistics by pattern for a user."""
+    # Unnest the JSON patterns array inside SQLite (JSON1) so only one row per
+    # (pattern, verdict) pair comes back instead of every attempt.
+    rows = db.execute(_PATTERN_VERDICT_COUNTS, {"user_id": user_id})
+    return _pivot_pattern_counts(rows)
+
+
+_TOP_PATTERNS = text(
+    """
+    SELECT
+        je.value AS pattern,
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE pa.verdict = 'correct') AS correct,
+        COUNT(*) OVER () AS pattern_count
+    FROM problem_attempts AS pa, json_each(pa.patterns) AS je
+    WHERE pa.user_id = :user_id
+    GROUP BY je.value
+    ORDER BY total DESC, pattern
+    LIMIT :n
+    """
+)
+
+
+def get_top_patterns(db: Session, user_id: str, n: int) -> tuple[list[dict], int]:
+    """
+    Get the user's n most practiced patterns, most attempts first.
+
+    Returns ([{"pattern", "total", "correct"}, ...], number of distinct
+    patterns); the ranking and the cut happen in SQL.
+    """
+    rows = db.execute(_TOP_PATTERNS, {"user_id": user_id, "n": n}).mappings().all()
+    top = [
+        {"pattern": r["pattern"], "total": r["total"], "correct": r["correct"]}
+        for r in rows
+    ]
+    return top, rows[0]["pattern_count"] if rows else 0
+
+
+def get_difficulty_stats(db: Session, user_id: str) -> dict[str, dict]:
+    """Get statistics by difficulty for a user."""
+    rows = (
+        db.query(ProblemAttempt.difficulty, ProblemAttempt.verdict, func.count())
+        .filter(ProblemAttempt.user_id == user_id)
+        .group_by(ProblemAttempt.difficulty, ProblemAttempt.verdict)
+        .all()
+    )
+    return _pivot_difficulty_counts(rows)
+
+
 def get_weekly_activity(db: Session, user_id: str, weeks: int = 12) -> list[dict]:
     """Get weekly problem count for the last N weeks."""
     end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(weeks=weeks)
 
-    attempts = (
-        db.query(ProblemAttempt)
+    # Bucket by the Monday of each row's week inside SQLite.
+    week_start = func.strftime(
+        "%Y-%m-%d", ProblemAttempt.created_at, "weekday 0", "-6 days"
+    )
+    rows = (
+        db.query(week_start, func.count())
         .filter(
             ProblemAttempt.user_id == user_id,
             ProblemAttempt.created_at >= start_date,
         )
-        .all()
+        .group_by(week_start)
     )
+    return _fill_weeks(dict(rows.all()), start_date, end_date)
 
-    # Group by week
-    weekly_data: dict[str, int] = {}
-    for attempt in attempts:
-        week_start = attempt.created_at - timedelta(days=attempt.created_at.weekday())
-        week_key = week_start.strftime("%Y-%m-%d")
-        weekly_data[week_key] = weekly_data.get(week_key, 0) + 1
 
-    # Fill in missing weeks
-    result = []
-    current = start_date
-    while current <= end_date:
-        week_key = current.strftime("%Y-%m-%d")
-        result.append(
-            {
-                "week": week_key,
-                "count": weekly_data.get(week_key, 0),
-            }
-        )
-        current += timedelta(weeks=1)
+# One pass over the user's attempts (materialized once) feeding all three
+# rollups; `kind` tags which rollup each row belongs to.
+_ALL_STATS = text(
+    """
+    WITH ua AS MATERIALIZED (
+        SELECT patterns, difficulty, verdict, created_at
+        FROM problem_attempts
+        WHERE user_id = :user_id
+    )
+    SELECT 'pattern' AS kind, je.value AS key, ua.verdict AS verdict, COUNT(*) AS n
+    FROM ua, json_each(ua.patterns) AS je
+    GROUP BY je.value, ua.verdict
+    UNION ALL
+    SELECT 'difficulty', difficulty, verdict, COUNT(*)
+    FROM ua
+    GROUP BY difficulty, verdict
+    UNION ALL
+    SELECT 'week', strftime('%Y-%m-%d', created_at, 'weekday 0', '-6 days'), NULL,
+           COUNT(*)
+    FROM ua
+    WHERE created_at >= :start
+    GROUP BY 2
+    """
+).bindparams(bindparam("start", type_=DateTime))
 
-    return result
+
+def get_all_stats(db: Session, user_id: str, weeks: int = 12) -> dict:
+    """
+    Get pattern, difficulty, and weekly stats for a user in a single query.
+
+    Returns {"patterns": ..., "difficulty": ..., "weekly": ...} in the same
+    shapes as get_pattern_stats, get_difficulty_stats, and get_weekly_activity,
+    plus "total"/"correct" attempt counts taken from the same snapshot.
+    """
+    end_date = datetime.now(timezone.utc)
+    start_date = end_date - timedelta(weeks=weeks)
+
+    pattern_rows = []
+    difficulty_rows = []
+    weekly_data: dict[str, int] = {}
+    result = db.execute(_ALL_STATS, {"user_id": user_id, "start": start_date})
+    for row in result.mappings():
+        if row["kind"] == "pattern":
+            pattern_rows.append((row["key"], row["verdict"], row["n"]))
+        elif row["kind"] == "difficulty":
+            difficulty_rows.append((row["key"], row["verdict"], row["n"]))
+        else:
+            weekly_data[row["key"]] = row["n"]
+
+    # The difficulty rollup groups every attempt exactly once, so it also
+    # yields the overall counts (including difficulties the pivot ignores).
+    return {
+        "total": sum(n for _, _, n in difficulty_rows),
+        "correct": sum(n for _, verdict, n in difficulty_rows if verdict == "correct"),
+        "patterns": _pivot_pattern_counts(pattern_rows),
+        "difficulty": _pivot_difficulty_counts(difficulty_rows),
+        "weekly": _fill_weeks(weekly_data, start_date, end_date),
+    }
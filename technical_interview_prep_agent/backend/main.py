@@ -1,10 +1,16 @@
-import json
+import asyncio
+import hashlib
 import logging
 import os
 import re
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from types import MappingProxyType
 
 from core import (
     CandidateProfile,
@@ -14,30 +20,49 @@ from core import (
     generate_hint,
     generate_personalized_problem,
 )
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import StreamingResponse
 from memory_utils import MemoriManager
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Text, case, func, select, type_coerce, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
 
 from backend.database import (
+    ATTEMPT_LIST_COLUMNS,
     Bookmark,
+    BookmarkCollection,
     MockInterviewSession,
     ProblemAttempt,
     StudyPlan,
     calculate_next_review,
+    create_attempt,
+    db_session,
+    find_current_week_plan,
+    get_all_stats,
+    get_attempt_counts,
+    get_attempts_version,
     get_difficulty_stats,
     get_due_problems,
-    get_pattern_stats,
+    get_mock_sessions_version,
+    get_top_patterns,
     get_session,
-    get_weekly_activity,
     init_database,
+    sm2_next,
 )
 
 # --- Request / Response models ---
 
 
-class InitRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base for request bodies: immutable once validated, unknown keys dropped."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class InitRequest(RequestModel):
     userId: str
     openaiKey: str | None = None
     memoriKey: str | None = None
@@ -47,14 +72,14 @@ class InitResponse(BaseModel):
     profile: CandidateProfile | None = None
 
 
-class ProfileRequest(BaseModel):
+class ProfileRequest(RequestModel):
     userId: str
     profile: CandidateProfile
     openaiKey: str | None = None
     memoriKey: str | None = None
 
 
-class ProblemRequest(BaseModel):
+class ProblemRequest(RequestModel):
     userId: str
     profile: CandidateProfile
     difficulty: str
@@ -63,7 +88,7 @@ class ProblemRequest(BaseModel):
     memoriKey: str | None = None
 
 
-class HintRequest(BaseModel):
+class HintRequest(RequestModel):
     userId: str
     problem: ProblemMetadata
     language: str
@@ -73,7 +98,7 @@ class HintRequest(BaseModel):
     memoriKey: str | None = None
 
 
-class EvaluateRequest(BaseModel):
+class EvaluateRequest(RequestModel):
     userId: str
     profile: CandidateProfile
     problem: ProblemMetadata
@@ -84,7 +109,7 @@ class EvaluateRequest(BaseModel):
     memoriKey: str | None = None
 
 
-class ProgressQuestionRequest(BaseModel):
+class ProgressQuestionRequest(RequestModel):
     userId: str
     question: str
     openaiKey: str | None = None
@@ -98,7 +123,7 @@ class UsageResponse(BaseModel):
 # --- New request/response models for features ---
 
 
-class SaveAttemptRequest(BaseModel):
+class SaveAttemptRequest(RequestModel):
     userId: str
     problem: ProblemMetadata
     language: str
@@ -112,7 +137,7 @@ class SaveAttemptRequest(BaseModel):
     mockSessionId: str | None = None
 
 
-class HistoryFilter(BaseModel):
+class HistoryFilter(RequestModel):
     userId: str
     difficulty: str | None = None
     pattern: str | None = None
@@ -122,14 +147,19 @@ class HistoryFilter(BaseModel):
     offset: int = 0
 
 
-class BookmarkRequest(BaseModel):
+class BookmarkRequest(RequestModel):
     userId: str
     attemptId: int
     collectionName: str = "Saved"
     notes: str | None = None
 
 
-class MockSessionRequest(BaseModel):
+class ReviewResult(RequestModel):
+    attemptId: int
+    wasCorrect: bool
+
+
+class MockSessionRequest(RequestModel):
     userId: str
     sessionType: str  # phone_screen, onsite, custom
     timeLimitMinutes: int = 45
@@ -139,14 +169,14 @@ class MockSessionRequest(BaseModel):
     memoriKey: str | None = None
 
 
-class StudyPlanRequest(BaseModel):
+class StudyPlanRequest(RequestModel):
     userId: str
     profile: CandidateProfile
     openaiKey: str | None = None
     memoriKey: str | None = None
 
 
-class CompanyProblemRequest(BaseModel):
+class CompanyProblemRequest(RequestModel):
     userId: str
     profile: CandidateProfile
     company: str
@@ -155,13 +185,28 @@ class CompanyProblemRequest(BaseModel):
     memoriKey: str | None = None
 
 
+_VERDICT_RE = re.compile(r"\b(incorrect|wrong|partially|correct)\b", re.IGNORECASE)
+_COMPLEXITY_RE = re.compile(r"O\([^)]+\)")
+# Verdicts appear near the top of the evaluation; don't scan the whole text.
+_VERDICT_SCAN_CHARS = 4096
+
+
+# Per-process MemoriManager cache: LRU-bounded, entries expire after the TTL.
+_MANAGER_CACHE_MAXSIZE = 1024
+_MANAGER_CACHE_TTL_SECONDS = 1800
+_manager_cache: OrderedDict[tuple[str, str], tuple[float, MemoriManager]] = (
+    OrderedDict()
+)
+_manager_cache_lock = threading.Lock()
+
+
 def _get_memori_manager(
     user_id: str,
     openai_key_override: str | None = None,
     memori_key_override: str | None = None,
 ) -> MemoriManager:
     """
-    Create a MemoriManager for the given logical user id.
+    Get a (cached) MemoriManager for the given logical user id.
 
     If the caller provides their own OpenAI key, we use that instead of the env var.
     """
@@ -177,16 +222,59 @@ def _get_memori_manager(
             detail="No OpenAI API key available. Provide your own or configure OPENAI_API_KEY on the backend.",
         )
 
-    # memori_key_override is accepted for future use / Memori cloud features
-    # For now, Memori uses the OpenAI key for embeddings, so we just pass openai_key.
-    mgr = MemoriManager(
-        openai_api_key=openai_key,
-        sqlite_path=os.getenv("INTERVIEW_SQLITE_PATH") or "./memori_interview.sqlite",
-        entity_id=user_id,
-    )
+    # Reuse a warm manager per (user, key) instead of rebuilding the Memori
+    # storage and OpenAI client on every request. Only a hash of the key is
+    # kept in the cache key. Sharing is safe: the manager serializes its calls
+    # into Memori (see MemoriManager._memori_call_lock).
+    cache_key = (user_id, hashlib.sha256(openai_key.encode()).hexdigest())
+    now = time.monotonic()
+    with _manager_cache_lock:
+        cached = _manager_cache.get(cache_key)
+        if cached is not None and now - cached[0] < _MANAGER_CACHE_TTL_SECONDS:
+            _manager_cache.move_to_end(cache_key)
+            return cached[1]
+
+        # memori_key_override is accepted for future use / Memori cloud features
+        # For now, Memori uses the OpenAI key for embeddings, so we just pass openai_key.
+        mgr = MemoriManager(
+            openai_api_key=openai_key,
+            sqlite_path=os.getenv("INTERVIEW_SQLITE_PATH")
+            or "./memori_interview.sqlite",
+            entity_id=user_id,
+        )
+        _manager_cache[cache_key] = (now, mgr)
+        _manager_cache.move_to_end(cache_key)
+        while len(_manager_cache) > _MANAGER_CACHE_MAXSIZE:
+            _manager_cache.popitem(last=False)
     return mgr
 
 
+# Polled read endpoints (/analytics, /mock/history) are cached per
+# (endpoint, user) together with a cheap data-version probe; an entry is
+# served only while its version still matches. Least recently used entries
+# are evicted past the size bound.
+_READ_CACHE_MAXSIZE = 4096
+_read_cache: OrderedDict[tuple[str, str], tuple[tuple, dict]] = OrderedDict()
+_read_cache_lock = threading.Lock()
+
+
+def _read_cache_get(endpoint: str, user_id: str, version: tuple) -> dict | None:
+    with _read_cache_lock:
+        cached = _read_cache.get((endpoint, user_id))
+        if cached is None or cached[0] != version:
+            return None
+        _read_cache.move_to_end((endpoint, user_id))
+        return cached[1]
+
+
+def _read_cache_put(endpoint: str, user_id: str, version: tuple, data: dict) -> None:
+    with _read_cache_lock:
+        _read_cache[(endpoint, user_id)] = (version, data)
+        _read_cache.move_to_end((endpoint, user_id))
+        while len(_read_cache) > _READ_CACHE_MAXSIZE:
+            _read_cache.popitem(last=False)
+
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -219,6 +307,32 @@ app.add_middleware(
 )
 
 
+def _save_new_attempt(was_correct: bool, **fields) -> int:
+    """Insert an attempt in its own session; for use from worker threads."""
+    db = get_session()
+    try:
+        attempt_id = create_attempt(db, was_correct, **fields)
+        db.commit()
+        return attempt_id
+    finally:
+        db.close()
+
+
+def _run_in_session(fn, *args, **kwargs):
+    """Call fn(db, *args, **kwargs) in its own session; for worker threads."""
+    db = get_session()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+def _add_and_commit(db: Session, obj):
+    db.add(obj)
+    db.commit()
+    return obj
+
+
 @app.get("/health")
 def health_check() -> dict:
     return {"status": "ok"}
@@ -255,26 +369,28 @@ def save_profile(req: ProfileRequest) -> UsageResponse:
 
 
 @app.post("/problem", response_model=ProblemMetadata)
-def generate_problem(req: ProblemRequest) -> ProblemMetadata:
+async def generate_problem(req: ProblemRequest) -> ProblemMetadata:
     """
     Generate a personalized problem for the candidate, considering:
     - Their profile
     - Desired difficulty and patterns
     - Weakness summary from prior attempts (queried via Memori)
     """
-    mgr = _get_memori_manager(req.userId, req.openaiKey)
+    mgr = await asyncio.to_thread(_get_memori_manager, req.userId, req.openaiKey)
 
     weakness_context = ""
     try:
-        weakness_context = mgr.summarize_performance(
+        weakness_context = await asyncio.to_thread(
+            mgr.summarize_performance,
             "In 3–5 bullet points, summarize my weakest algorithm/data-structure "
-            "patterns and typical difficulties."
+            "patterns and typical difficulties.",
         )
     except Exception:
         weakness_context = ""
 
     model_name = os.getenv("INTERVIEW_MODEL", "gpt-4o-mini")
-    problem = generate_personalized_problem(
+    problem = await asyncio.to_thread(
+        generate_personalized_problem,
         profile=req.profile,
         difficulty=req.difficulty,
         patterns=req.patterns,
@@ -285,14 +401,16 @@ def generate_problem(req: ProblemRequest) -> ProblemMetadata:
 
 
 @app.post("/hint")
-def generate_hint_endpoint(req: HintRequest) -> dict:
+async def generate_hint_endpoint(req: HintRequest) -> dict:
     """
     Generate an incremental hint for the current attempt.
     """
-    _get_memori_manager(req.userId, req.openaiKey)  # Validate API key
+    # Validate API key
+    await asyncio.to_thread(_get_memori_manager, req.userId, req.openaiKey)
 
     model_name = os.getenv("INTERVIEW_MODEL", "gpt-4o-mini")
-    hint = generate_hint(
+    hint = await asyncio.to_thread(
+        generate_hint,
         problem=req.problem,
         language=req.language,
         code_so_far=req.codeSoFar,
@@ -303,15 +421,16 @@ def generate_hint_endpoint(req: HintRequest) -> dict:
 
 
 @app.post("/evaluate")
-def evaluate_solution_endpoint(req: EvaluateRequest) -> dict:
+async def evaluate_solution_endpoint(req: EvaluateRequest) -> dict:
     """
     Evaluate the candidate's solution and log the attempt into Memori.
     Also saves to database for history/analytics.
     """
-    mgr = _get_memori_manager(req.userId, req.openaiKey)
+    mgr = await asyncio.to_thread(_get_memori_manager, req.userId, req.openaiKey)
 
     model_name = os.getenv("INTERVIEW_MODEL", "gpt-4o-mini")
-    evaluation_md = evaluate_solution(
+    evaluation_md = await asyncio.to_thread(
+        evaluate_solution,
         problem=req.problem,
         language=req.language,
         candidate_code=req.candidateCode,
@@ -326,52 +445,44 @@ def evaluate_solution_endpoint(req: EvaluateRequest) -> dict:
         hints=req.hints,
         evaluation_markdown=evaluation_md,
     )
+    # Queued for Memori's background writer; returns without waiting.
     mgr.log_problem_attempt(attempt_summary)
 
-    # Parse verdict from evaluation (look for patterns like "correct", "incorrect", "partially")
+    # Parse verdict from evaluation: the first verdict word wins, since the
+    # "## Verdict" section comes first in the evaluation template.
     verdict = "partially_correct"
-    eval_lower = evaluation_md.lower()
-    if "incorrect" in eval_lower or "wrong" in eval_lower:
-        verdict = "incorrect"
-    elif "correct" in eval_lower and "partially" not in eval_lower:
-        verdict = "correct"
+    verdict_match = _VERDICT_RE.search(evaluation_md, 0, _VERDICT_SCAN_CHARS)
+    if verdict_match:
+        word = verdict_match.group(1).lower()
+        if word in ("incorrect", "wrong"):
+            verdict = "incorrect"
+        elif word == "correct":
+            verdict = "correct"
 
     # Extract complexity if mentioned
     time_complexity = None
     space_complexity = None
-    time_match = re.search(r"O\([^)]+\)", evaluation_md)
+    time_match = _COMPLEXITY_RE.search(evaluation_md)
     if time_match:
         time_complexity = time_match.group(0)
 
     # Save to database for history/analytics
-    db = get_session()
-    try:
-        attempt = ProblemAttempt(
-            user_id=req.userId,
-            title=req.problem.title,
-            difficulty=req.problem.difficulty,
-            patterns=json.dumps(req.problem.patterns),
-            statement=req.problem.statement,
-            language=req.language,
-            code=req.candidateCode,
-            hints_used=len(req.hints),
-            verdict=verdict,
-            time_complexity=time_complexity,
-            space_complexity=space_complexity,
-            evaluation_markdown=evaluation_md,
-            next_review_at=datetime.now(timezone.utc),
-        )
-        db.add(attempt)
-        db.commit()
-        db.refresh(attempt)
-
-        # Calculate next review
-        calculate_next_review(attempt, verdict == "correct")
-        db.commit()
-
-        attempt_id = attempt.id
-    finally:
-        db.close()
+    attempt_id = await asyncio.to_thread(
+        _save_new_attempt,
+        verdict == "correct",
+        user_id=req.userId,
+        title=req.problem.title,
+        difficulty=req.problem.difficulty,
+        patterns=req.problem.patterns,
+        statement=req.problem.statement,
+        language=req.language,
+        code=req.candidateCode,
+        hints_used=len(req.hints),
+        verdict=verdict,
+        time_complexity=time_complexity,
+        space_complexity=space_complexity,
+        evaluation_markdown=evaluation_md,
+    )
 
     return {
         "evaluationMarkdown": evaluation_md,
@@ -396,88 +507,80 @@ def summarize_progress(req: ProgressQuestionRequest) -> dict:
 
 
 @app.post("/attempts/save")
-def save_attempt(req: SaveAttemptRequest) -> dict:
+def save_attempt(req: SaveAttemptRequest, db: Session = Depends(db_session)) -> dict:
     """Save a problem attempt to the database for history/analytics."""
-    db = get_session()
-    try:
-        attempt = ProblemAttempt(
-            user_id=req.userId,
-            title=req.problem.title,
-            difficulty=req.problem.difficulty,
-            patterns=json.dumps(req.problem.patterns),
-            statement=req.problem.statement,
-            language=req.language,
-            code=req.code,
-            hints_used=req.hintsUsed,
-            verdict=req.verdict,
-            time_complexity=req.timeComplexity,
-            space_complexity=req.spaceComplexity,
-            evaluation_markdown=req.evaluationMarkdown,
-            company_style=req.companyStyle,
-            mock_session_id=req.mockSessionId,
-            next_review_at=datetime.now(
-                timezone.utc
-            ),  # Due immediately for first review
-        )
-        db.add(attempt)
-        db.commit()
-        db.refresh(attempt)
-
-        # Calculate next review based on verdict
-        was_correct = req.verdict == "correct"
-        calculate_next_review(attempt, was_correct)
-        db.commit()
+    attempt_id = create_attempt(
+        db,
+        req.verdict == "correct",
+        user_id=req.userId,
+        title=req.problem.title,
+        difficulty=req.problem.difficulty,
+        patterns=req.problem.patterns,
+        statement=req.problem.statement,
+        language=req.language,
+        code=req.code,
+        hints_used=req.hintsUsed,
+        verdict=req.verdict,
+        time_complexity=req.timeComplexity,
+        space_complexity=req.spaceComplexity,
+        evaluation_markdown=req.evaluationMarkdown,
+        company_style=req.companyStyle,
+        mock_session_id=req.mockSessionId,
+    )
+    db.commit()
 
-        return {"success": True, "attemptId": attempt.id}
-    finally:
-        db.close()
+    return {"success": True, "attemptId": attempt_id}
 
 
 @app.post("/attempts/history")
-def get_history(req: HistoryFilter) -> dict:
-    """Get problem attempt history with optional filters."""
-    db = get_session()
-    try:
-        query = db.query(ProblemAttempt).filter(ProblemAttempt.user_id == req.userId)
-
-        if req.difficulty:
-            query = query.filter(ProblemAttempt.difficulty == req.difficulty)
-        if req.verdict:
-            query = query.filter(ProblemAttempt.verdict == req.verdict)
-        if req.companyStyle:
-            query = query.filter(ProblemAttempt.company_style == req.companyStyle)
-        if req.pattern:
-            query = query.filter(ProblemAttempt.patterns.contains(req.pattern))
-
-        total = query.count()
-        attempts = (
-            query.order_by(ProblemAttempt.created_at.desc())
-            .offset(req.offset)
-            .limit(req.limit)
-            .all()
+def get_history(req: HistoryFilter, db: Session = Depends(db_session)) -> dict:
+    """
+    Get problem attempt history with optional filters.
+
+    Returns slim list rows; fetch /attempts/{attempt_id} for code and evaluation.
+    """
+    query = db.query(ProblemAttempt).filter(ProblemAttempt.user_id == req.userId)
+
+    if req.difficulty:
+        query = query.filter(ProblemAttempt.difficulty == req.difficulty)
+    if req.verdict:
+        query = query.filter(ProblemAttempt.verdict == req.verdict)
+    if req.companyStyle:
+        query = query.filter(ProblemAttempt.company_style == req.companyStyle)
+    if req.pattern:
+        # Substring match over the stored JSON text, e.g. "tree" matches "trees".
+        query = query.filter(
+            type_coerce(ProblemAttempt.patterns, Text).contains(req.pattern)
         )
 
-        return {
-            "total": total,
-            "attempts": [a.to_dict() for a in attempts],
-        }
-    finally:
-        db.close()
+    # The window count is evaluated before LIMIT/OFFSET, so one query
+    # returns both the page and the total match count.
+    rows = (
+        query.options(load_only(*ATTEMPT_LIST_COLUMNS))
+        .add_columns(func.count().over().label("total"))
+        .order_by(ProblemAttempt.created_at.desc())
+        .offset(req.offset)
+        .limit(req.limit)
+        .all()
+    )
+    if rows:
+        total = rows[0].total
+    else:
+        total = query.count() if req.offset else 0
+
+    return {
+        "total": total,
+        "attempts": [attempt.to_list_dict() for attempt, _ in rows],
+    }
 
 
 @app.get("/attempts/{attempt_id}")
-def get_attempt(attempt_id: int) -> dict:
+def get_attempt(attempt_id: int, db: Session = Depends(db_session)) -> dict:
     """Get a single attempt by ID for retry."""
-    db = get_session()
-    try:
-        attempt = (
-            db.query(ProblemAttempt).filter(ProblemAttempt.id == attempt_id).first()
-        )
-        if not attempt:
-            raise HTTPException(status_code=404, detail="Attempt not found")
-        return attempt.to_dict()
-    finally:
-        db.close()
+    attempt = db.get(ProblemAttempt, attempt_id)
+    if not attempt:
+        raise HTTPException(status_code=404, detail="Attempt not found")
+    return attempt.to_dict()
 
 
 # ============================================
@@ -486,40 +589,95 @@ def get_attempt(attempt_id: int) -> dict:
 
 
 @app.get("/review/due/{user_id}")
-def get_due_for_review(user_id: str, limit: int = 10) -> dict:
+def get_due_for_review(
+    user_id: str, limit: int = 10, db: Session = Depends(db_session)
+) -> dict:
     """Get problems due for spaced repetition review."""
-    db = get_session()
-    try:
-        due = get_due_problems(db, user_id, limit)
-        return {
-            "dueCount": len(due),
-            "problems": [a.to_dict() for a in due],
-        }
-    finally:
-        db.close()
+    due = get_due_problems(db, user_id, limit)
+    return {
+        "dueCount": len(due),
+        "problems": [a.to_list_dict() for a in due],
+    }
 
 
 @app.post("/review/complete/{attempt_id}")
-def complete_review(attempt_id: int, was_correct: bool) -> dict:
+def complete_review(
+    attempt_id: int, was_correct: bool, db: Session = Depends(db_session)
+) -> dict:
     """Mark a review as complete and calculate next review date."""
-    db = get_session()
-    try:
-        attempt = (
-            db.query(ProblemAttempt).filter(ProblemAttempt.id == attempt_id).first()
+    # Only the scheduling columns are read and written here.
+    attempt = (
+        db.query(ProblemAttempt)
+        .options(
+            load_only(
+                ProblemAttempt.id,
+                ProblemAttempt.review_interval_days,
+                ProblemAttempt.ease_factor,
+                ProblemAttempt.next_review_at,
+            )
         )
-        if not attempt:
-            raise HTTPException(status_code=404, detail="Attempt not found")
+        .filter(ProblemAttempt.id == attempt_id)
+        .first()
+    )
+    if not attempt:
+        raise HTTPException(status_code=404, detail="Attempt not found")
 
-        next_review = calculate_next_review(attempt, was_correct)
-        db.commit()
+    next_review = calculate_next_review(attempt, was_correct)
+    db.commit()
 
-        return {
-            "success": True,
-            "nextReviewAt": next_review.isoformat(),
-            "intervalDays": attempt.review_interval_days,
+    return {
+        "success": True,
+        "nextReviewAt": next_review.isoformat(),
+        "intervalDays": attempt.review_interval_days,
+    }
+
+
+@app.post("/review/complete-bulk")
+def complete_reviews_bulk(
+    results: list[ReviewResult], db: Session = Depends(db_session)
+) -> dict:
+    """Mark several reviews complete in one transaction (one commit/fsync)."""
+    ids = {r.attemptId for r in results}
+    schedules = {
+        row.id: (row.review_interval_days, row.ease_factor)
+        for row in db.query(
+            ProblemAttempt.id,
+            ProblemAttempt.review_interval_days,
+            ProblemAttempt.ease_factor,
+        ).filter(ProblemAttempt.id.in_(ids))
+    }
+
+    updates: dict[int, dict] = {}
+    not_found = []
+    for r in results:
+        if r.attemptId not in schedules:
+            not_found.append(r.attemptId)
+            continue
+        interval, ease, next_review = sm2_next(*schedules[r.attemptId], r.wasCorrect)
+        schedules[r.attemptId] = (interval, ease)
+        updates[r.attemptId] = {
+            "id": r.attemptId,
+            "review_interval_days": interval,
+            "ease_factor": ease,
+            "next_review_at": next_review,
         }
-    finally:
-        db.close()
+
+    if updates:
+        db.execute(update(ProblemAttempt), list(updates.values()))
+        db.commit()
+
+    return {
+        "success": True,
+        "reviews": [
+            {
+                "attemptId": u["id"],
+                "nextReviewAt": u["next_review_at"].isoformat(),
+                "intervalDays": u["review_interval_days"],
+            }
+            for u in updates.values()
+        ],
+        "notFound": not_found,
+    }
 
 
 # ============================================
@@ -528,82 +686,116 @@ def complete_review(attempt_id: int, was_correct: bool) -> dict:
 
 
 @app.post("/bookmarks/add")
-def add_bookmark(req: BookmarkRequest) -> dict:
+def add_bookmark(req: BookmarkRequest, db: Session = Depends(db_session)) -> dict:
     """Add a problem to a bookmark collection."""
-    db = get_session()
+    # Single atomic statement; the unique (user_id, attempt_id,
+    # collection_name) index turns a duplicate into a no-op.
+    stmt = (
+        sqlite_insert(Bookmark)
+        .values(
+            user_id=req.userId,
+            attempt_id=req.attemptId,
+            collection_name=req.collectionName,
+            notes=req.notes,
+        )
+        .on_conflict_do_nothing(
+            index_elements=["user_id", "attempt_id", "collection_name"]
+        )
+        .returning(Bookmark.id)
+    )
     try:
-        # Check if already bookmarked
-        existing = (
-            db.query(Bookmark)
+        bookmark_id = db.execute(stmt).scalar_one_or_none()
+    except IntegrityError:
+        # foreign_keys=ON: the attempt doesn't exist.
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Attempt not found")
+    if bookmark_id is not None:
+        db.execute(
+            sqlite_insert(BookmarkCollection)
+            .values(user_id=req.userId, name=req.collectionName)
+            .on_conflict_do_nothing(index_elements=["user_id", "name"])
+        )
+    db.commit()
+
+    if bookmark_id is None:
+        existing_id = (
+            db.query(Bookmark.id)
             .filter(
                 Bookmark.user_id == req.userId,
                 Bookmark.attempt_id == req.attemptId,
                 Bookmark.collection_name == req.collectionName,
             )
-            .first()
-        )
-
-        if existing:
-            return {
-                "success": True,
-                "bookmarkId": existing.id,
-                "message": "Already bookmarked",
-            }
-
-        bookmark = Bookmark(
-            user_id=req.userId,
-            attempt_id=req.attemptId,
-            collection_name=req.collectionName,
-            notes=req.notes,
+            .scalar()
         )
-        db.add(bookmark)
-        db.commit()
-        db.refresh(bookmark)
+        return {
+            "success": True,
+            "bookmarkId": existing_id,
+            "message": "Already bookmarked",
+        }
 
-        return {"success": True, "bookmarkId": bookmark.id}
-    finally:
-        db.close()
+    return {"success": True, "bookmarkId": bookmark_id}
 
 
 @app.get("/bookmarks/{user_id}")
-def get_bookmarks(user_id: str, collection: str | None = None) -> dict:
-    """Get all bookmarks for a user, optionally filtered by collection."""
-    db = get_session()
-    try:
-        query = db.query(Bookmark).filter(Bookmark.user_id == user_id)
-        if collection:
-            query = query.filter(Bookmark.collection_name == collection)
-
-        bookmarks = query.order_by(Bookmark.created_at.desc()).all()
-
-        # Get unique collection names
-        collections = (
-            db.query(Bookmark.collection_name)
-            .filter(Bookmark.user_id == user_id)
-            .distinct()
-            .all()
+def get_bookmarks(
+    user_id: str, collection: str | None = None, db: Session = Depends(db_session)
+) -> dict:
+    """
+    Get all bookmarks for a user, optionally filtered by collection.
+    Each bookmark includes the attempt's title and difficulty.
+    """
+    query = (
+        db.query(Bookmark)
+        .options(
+            selectinload(Bookmark.attempt).load_only(
+                ProblemAttempt.id,
+                ProblemAttempt.title,
+                ProblemAttempt.difficulty,
+            )
         )
+        .filter(Bookmark.user_id == user_id)
+    )
+    if collection:
+        query = query.filter(Bookmark.collection_name == collection)
 
-        return {
-            "bookmarks": [b.to_dict() for b in bookmarks],
-            "collections": [c[0] for c in collections],
-        }
-    finally:
-        db.close()
+    bookmarks = query.order_by(Bookmark.created_at.desc()).all()
+
+    collections = (
+        db.query(BookmarkCollection.name)
+        .filter(BookmarkCollection.user_id == user_id)
+        .order_by(BookmarkCollection.id)
+        .all()
+    )
+
+    return {
+        "bookmarks": [b.to_dict(include_attempt=True) for b in bookmarks],
+        "collections": [c[0] for c in collections],
+    }
 
 
 @app.delete("/bookmarks/{bookmark_id}")
-def delete_bookmark(bookmark_id: int) -> dict:
+def delete_bookmark(bookmark_id: int, db: Session = Depends(db_session)) -> dict:
     """Remove a bookmark."""
-    db = get_session()
-    try:
-        bookmark = db.query(Bookmark).filter(Bookmark.id == bookmark_id).first()
-        if bookmark:
-            db.delete(bookmark)
-            db.commit()
-        return {"success": True}
-    finally:
-        db.close()
+    bookmark = db.get(Bookmark, bookmark_id)
+    if bookmark:
+        db.delete(bookmark)
+        db.flush()
+        # Drop the collection name once its last bookmark is gone.
+        still_used = db.query(
+            db.query(Bookmark.id)
+            .filter(
+                Bookmark.user_id == bookmark.user_id,
+                Bookmark.collection_name == bookmark.collection_name,
+            )
+            .exists()
+        ).scalar()
+        if not still_used:
+            db.query(BookmarkCollection).filter(
+                BookmarkCollection.user_id == bookmark.user_id,
+                BookmarkCollection.name == bookmark.collection_name,
+            ).delete(synchronize_session=False)
+        db.commit()
+    return {"success": True}
 
 
 # ============================================
@@ -612,132 +804,138 @@ def delete_bookmark(bookmark_id: int) -> dict:
 
 
 @app.post("/mock/start")
-def start_mock_session(req: MockSessionRequest) -> dict:
+def start_mock_session(
+    req: MockSessionRequest, db: Session = Depends(db_session)
+) -> dict:
     """Start a new mock interview session."""
-    db = get_session()
-    try:
-        session_id = str(uuid.uuid4())
-
-        # Determine difficulties based on session type
-        if not req.difficulties:
-            if req.sessionType == "phone_screen":
-                difficulties = ["Easy", "Medium"]
-            elif req.sessionType == "onsite":
-                difficulties = ["Medium", "Medium", "Hard"]
-            else:
-                difficulties = ["Medium"] * req.numProblems
+    session_id = str(uuid.uuid4())
+
+    # Determine difficulties based on session type
+    if not req.difficulties:
+        if req.sessionType == "phone_screen":
+            difficulties = ["Easy", "Medium"]
+        elif req.sessionType == "onsite":
+            difficulties = ["Medium", "Medium", "Hard"]
         else:
-            difficulties = req.difficulties
-
-        session = MockInterviewSession(
-            id=session_id,
-            user_id=req.userId,
-            session_type=req.sessionType,
-            time_limit_minutes=req.timeLimitMinutes,
-            num_problems=len(difficulties),
-            difficulties=json.dumps(difficulties),
-        )
-        db.add(session)
-        db.commit()
+            difficulties = ["Medium"] * req.numProblems
+    else:
+        difficulties = req.difficulties
+
+    session = MockInterviewSession(
+        id=session_id,
+        user_id=req.userId,
+        session_type=req.sessionType,
+        time_limit_minutes=req.timeLimitMinutes,
+        num_problems=len(difficulties),
+        difficulties=difficulties,
+    )
+    db.add(session)
+    db.commit()
 
-        return {
-            "sessionId": session_id,
-            "timeLimitMinutes": req.timeLimitMinutes,
-            "numProblems": len(difficulties),
-            "difficulties": difficulties,
-        }
-    finally:
-        db.close()
+    return {
+        "sessionId": session_id,
+        "timeLimitMinutes": req.timeLimitMinutes,
+        "numProblems": len(difficulties),
+        "difficulties": difficulties,
+    }
 
 
 @app.get("/mock/session/{session_id}")
-def get_mock_session(session_id: str) -> dict:
+def get_mock_session(session_id: str, db: Session = Depends(db_session)) -> dict:
     """Get mock session details."""
-    db = get_session()
-    try:
-        session = (
-            db.query(MockInterviewSession)
-            .filter(MockInterviewSession.id == session_id)
-            .first()
-        )
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        # Get problems for this session
-        problems = (
-            db.query(ProblemAttempt)
-            .filter(ProblemAttempt.mock_session_id == session_id)
-            .all()
-        )
+    # Primary-key lookup; the session and its problems come back in one
+    # LEFT OUTER JOIN round trip, and a missing session is just None.
+    session = db.get(
+        MockInterviewSession,
+        session_id,
+        options=[joinedload(MockInterviewSession.problems)],
+    )
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
 
-        return {
-            **session.to_dict(),
-            "problems": [p.to_dict() for p in problems],
-        }
-    finally:
-        db.close()
+    return {
+        **session.to_dict(),
+        "problems": [p.to_dict() for p in session.problems],
+    }
 
 
 @app.post("/mock/complete/{session_id}")
-def complete_mock_session(session_id: str) -> dict:
+def complete_mock_session(session_id: str, db: Session = Depends(db_session)) -> dict:
     """Complete a mock interview session and calculate score."""
-    db = get_session()
-    try:
-        session = (
-            db.query(MockInterviewSession)
-            .filter(MockInterviewSession.id == session_id)
-            .first()
+    # Aggregates are kept current by create_attempt(), so completing is a
+    # single UPDATE: stamp the time and average the accumulated points.
+    row = db.execute(
+        update(MockInterviewSession)
+        .where(MockInterviewSession.id == session_id)
+        .values(
+            completed_at=datetime.now(timezone.utc),
+            total_score=case(
+                (
+                    MockInterviewSession.problems_completed > 0,
+                    MockInterviewSession.score_sum
+                    * 1.0
+                    / MockInterviewSession.problems_completed,
+                ),
+                else_=0,
+            ),
         )
-        if not session:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        # Get problems and calculate score
-        problems = (
-            db.query(ProblemAttempt)
-            .filter(ProblemAttempt.mock_session_id == session_id)
-            .all()
+        .returning(
+            MockInterviewSession.total_score, MockInterviewSession.problems_completed
         )
+    ).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    db.commit()
 
-        total_score = 0
-        for p in problems:
-            if p.verdict == "correct":
-                total_score += 100
-            elif p.verdict == "partially_correct":
-                total_score += 50
+    total_score, problems_completed = row
+    return {
+        "success": True,
+        "score": float(total_score),
+        "problemsCompleted": problems_completed or 0,
+    }
 
-        if problems:
-            total_score = total_score / len(problems)
 
-        session.completed_at = datetime.now(timezone.utc)
-        session.problems_completed = len(problems)
-        session.total_score = total_score
-        db.commit()
-
-        return {
-            "success": True,
-            "score": total_score,
-            "problemsCompleted": len(problems),
-        }
-    finally:
-        db.close()
+_MOCK_HISTORY_MAX_LIMIT = 100
 
 
 @app.get("/mock/history/{user_id}")
-def get_mock_history(user_id: str) -> dict:
-    """Get mock interview session history."""
-    db = get_session()
-    try:
-        sessions = (
-            db.query(MockInterviewSession)
-            .filter(MockInterviewSession.user_id == user_id)
-            .order_by(MockInterviewSession.created_at.desc())
-            .limit(20)
-            .all()
-        )
+def get_mock_history(
+    user_id: str,
+    cursor: datetime | None = None,
+    limit: int = 20,
+    db: Session = Depends(db_session),
+) -> dict:
+    """
+    Get mock interview session history, newest first.
 
-        return {"sessions": [s.to_dict() for s in sessions]}
-    finally:
-        db.close()
+    Keyset-paginated: pass the previous page's nextCursor as `cursor` to get
+    sessions created before it. nextCursor is null on the last page.
+    """
+    limit = max(1, min(limit, _MOCK_HISTORY_MAX_LIMIT))
+
+    # Only the first page is polled by the dashboard, so only it is cached.
+    cache_key = f"mock_history:{limit}"
+    version = None
+    if cursor is None:
+        version = get_mock_sessions_version(db, user_id)
+        cached = _read_cache_get(cache_key, user_id, version)
+        if cached is not None:
+            return cached
+
+    query = db.query(MockInterviewSession).filter(
+        MockInterviewSession.user_id == user_id
+    )
+    if cursor is not None:
+        query = query.filter(MockInterviewSession.created_at < cursor)
+    sessions = query.order_by(MockInterviewSession.created_at.desc()).limit(limit).all()
+
+    data = {
+        "sessions": [s.to_dict() for s in sessions],
+        "nextCursor": sessions[-1].created_at if len(sessions) == limit else None,
+    }
+    if version is not None:
+        _read_cache_put(cache_key, user_id, version, data)
+    return data
 
 
 # ============================================
@@ -745,43 +943,51 @@ def get_mock_history(user_id: str) -> dict:
 # ============================================
 
 
-@app.get("/analytics/{user_id}")
-def get_analytics(user_id: str) -> dict:
-    """Get comprehensive analytics for a user."""
-    db = get_session()
-    try:
-        pattern_stats = get_pattern_stats(db, user_id)
-        difficulty_stats = get_difficulty_stats(db, user_id)
-        weekly_activity = get_weekly_activity(db, user_id)
-
-        # Total counts
-        total_attempts = (
-            db.query(ProblemAttempt).filter(ProblemAttempt.user_id == user_id).count()
-        )
+@app.get("/analytics/summary/{user_id}")
+def get_analytics_summary(user_id: str, db: Session = Depends(db_session)) -> dict:
+    """Get pattern, difficulty, and weekly rollups for a user in one query."""
+    stats = get_all_stats(db, user_id)
+    return {
+        "patternStats": stats["patterns"],
+        "difficultyStats": stats["difficulty"],
+        "weeklyActivity": stats["weekly"],
+    }
 
-        correct_attempts = (
-            db.query(ProblemAttempt)
-            .filter(
-                ProblemAttempt.user_id == user_id,
-                ProblemAttempt.verdict == "correct",
-            )
-            .count()
-        )
 
-        return {
-            "totalAttempts": total_attempts,
-            "correctAttempts": correct_attempts,
-            "accuracy": (
-                round(correct_attempts / total_attempts * 100, 1)
-                if total_attempts > 0
-                else 0
-            ),
-            "patternStats": pattern_stats,
-            "difficultyStats": difficulty_stats,
-            "weeklyActivity": weekly_activity,
-        }
-    finally:
-        db.close()
+@app.get("/analytics/{user_id}")
+async def get_analytics(user_id: str) -> dict:
+    """Get comprehensive analytics for a user."""
+    # Weekly buckets are relative to today, so the date is part of the version.
+    version = (
+        *await asyncio.to_thread(_run_in_session, get_attempts_version, user_id),
+        datetime.now(timezone.utc).date(),
+    )
+    cached = _read_cache_get("analytics", user_id, version)
+    if cached is not None:
+        return cached
+
+    # One query, so the counts and the rollups come from the same snapshot.
+    stats = await asyncio.to_thread(_run_in_session, get_all_stats, user_id)
+    total_attempts = stats["total"]
+    correct_attempts = stats["correct"]
+    pattern_stats = stats["patterns"]
+    difficulty_stats = stats["difficulty"]
+    weekly_activity = stats["weekly"]
+
+    data = {
+        "totalAttempts": total_attempts,
+        "correctAttempts": correct_attempts,
+        "accuracy": (
+            round(correct_attempts / total_attempts * 100, 1)
+            if total_attempts > 0
+            else 0
+        ),
+        "patternStats": pattern_stats,
+        "difficultyStats": difficulty_stats,
+        "weeklyActivity": weekly_activity,
+    }
+    _read_cache_put("analytics", user_id, version, data)
+    return data
 
 
 # ============================================
@@ -789,29 +995,33 @@ def get_analytics(user_id: str) -> dict:
 # ============================================
 
 
+# Company-specific patterns
+_COMPANY_PATTERNS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "Google": ("graphs", "dynamic programming", "system design", "arrays"),
+        "Meta": ("graphs", "trees", "dynamic programming", "strings"),
+        "Amazon": ("arrays", "trees", "system design", "OOP"),
+        "Apple": ("arrays", "strings", "linked list", "system design"),
+        "Microsoft": ("arrays", "trees", "dynamic programming", "graphs"),
+        "Netflix": ("system design", "distributed systems", "caching"),
+        "Stripe": ("API design", "strings", "hashing", "system design"),
+    }
+)
+_DEFAULT_COMPANY_PATTERNS = ("arrays", "strings", "trees")
+
+
 @app.post("/problem/company")
 def generate_company_problem(req: CompanyProblemRequest) -> ProblemMetadata:
     """Generate a problem tailored to a specific company's interview style."""
     _get_memori_manager(req.userId, req.openaiKey)  # Validate API key
 
-    # Company-specific patterns
-    company_patterns = {
-        "Google": ["graphs", "dynamic programming", "system design", "arrays"],
-        "Meta": ["graphs", "trees", "dynamic programming", "strings"],
-        "Amazon": ["arrays", "trees", "system design", "OOP"],
-        "Apple": ["arrays", "strings", "linked list", "system design"],
-        "Microsoft": ["arrays", "trees", "dynamic programming", "graphs"],
-        "Netflix": ["system design", "distributed systems", "caching"],
-        "Stripe": ["API design", "strings", "hashing", "system design"],
-    }
-
-    patterns = company_patterns.get(req.company, ["arrays", "strings", "trees"])
+    patterns = _COMPANY_PATTERNS.get(req.company, _DEFAULT_COMPANY_PATTERNS)
 
     model_name = os.getenv("INTERVIEW_MODEL", "gpt-4o-mini")
     problem = generate_personalized_problem(
         profile=req.profile,
         difficulty=req.difficulty,
-        patterns=patterns[:3],  # Focus on top 3 patterns
+        patterns=list(patterns[:3]),  # Focus on top 3 patterns
         weakness_context=f"This problem should be in the style of {req.company} interviews.",
         model_name=model_name,
     )
@@ -824,44 +1034,21 @@ def generate_company_problem(req: CompanyProblemRequest) -> ProblemMetadata:
 # ============================================
 
 
-@app.post("/study-plan/generate")
-def generate_study_plan(req: StudyPlanRequest) -> dict:
-    """Generate a personalized weekly study plan."""
-    mgr = _get_memori_manager(req.userId, req.openaiKey)
-
-    # Get analytics to inform the plan
-    db = get_session()
-    try:
-        pattern_stats = get_pattern_stats(db, req.userId)
-        difficulty_stats = get_difficulty_stats(db, req.userId)
-
-        # Find weak patterns
-        weak_patterns = []
-        for pattern, stats in pattern_stats.items():
-            if stats["total"] > 0:
-                accuracy = stats["correct"] / stats["total"]
-                if accuracy < 0.6:
-                    weak_patterns.append(pattern)
-
-        if not weak_patterns:
-            weak_patterns = ["arrays", "strings", "trees"]
-
-        # Generate plan using LLM
-        prompt = f"""Generate a 1-week study plan for a technical interview candidate.
+_STUDY_PLAN_PROMPT = """Generate a 1-week study plan for a technical interview candidate.
 
 Profile:
-- Target role: {req.profile.target_role}
-- Experience: {req.profile.experience_level}
-- Target companies: {", ".join(req.profile.target_companies) or "FAANG"}
-- Timeframe: {req.profile.timeframe}
-- Goal: {req.profile.main_goal}
+- Target role: {target_role}
+- Experience: {experience_level}
+- Target companies: {target_companies}
+- Timeframe: {timeframe}
+- Goal: {main_goal}
 
-Weak patterns that need focus: {", ".join(weak_patterns[:5])}
+Weak patterns that need focus: {weak_patterns}
 
 Current stats:
-- Easy: {difficulty_stats.get("Easy", {}).get("correct", 0)}/{difficulty_stats.get("Easy", {}).get("total", 0)} correct
-- Medium: {difficulty_stats.get("Medium", {}).get("correct", 0)}/{difficulty_stats.get("Medium", {}).get("total", 0)} correct
-- Hard: {difficulty_stats.get("Hard", {}).get("correct", 0)}/{difficulty_stats.get("Hard", {}).get("total", 0)} correct
+- Easy: {easy[correct]}/{easy[total]} correct
+- Medium: {medium[correct]}/{medium[total]} correct
+- Hard: {hard[correct]}/{hard[total]} correct
 
 Create a day-by-day plan for 7 days with:
 1. Which patterns to focus on each day
@@ -871,57 +1058,106 @@ Create a day-by-day plan for 7 days with:
 
 Format as markdown."""
 
-        response = mgr.openai_client.chat.completions.create(
-            model=os.getenv("INTERVIEW_MODEL", "gpt-4o-mini"),
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert technical interview coach.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-        )
-
-        plan_markdown = response.choices[0].message.content or ""
 
-        # Save the plan
-        plan = StudyPlan(
-            user_id=req.userId,
-            focus_patterns=json.dumps(weak_patterns[:5]),
-            daily_goal=3,
-            difficulty_focus="Medium",
-            plan_markdown=plan_markdown,
-        )
-        db.add(plan)
-        db.commit()
-        db.refresh(plan)
+@app.post("/study-plan/generate")
+async def generate_study_plan(req: StudyPlanRequest) -> dict:
+    """
+    Generate a personalized weekly study plan.
 
+    A plan already generated this week for the same weak patterns is
+    returned as-is instead of calling the LLM again.
+    """
+    # Get analytics to inform the plan. Short-lived sessions keep a pooled
+    # connection from being held open across the LLM call below.
+    stats = await asyncio.to_thread(_run_in_session, get_all_stats, req.userId)
+    pattern_stats = stats["patterns"]
+    difficulty_stats = stats["difficulty"]
+
+    # Find weak patterns
+    weak_patterns = []
+    for pattern, p_stats in pattern_stats.items():
+        if p_stats["total"] > 0:
+            accuracy = p_stats["correct"] / p_stats["total"]
+            if accuracy < 0.6:
+                weak_patterns.append(pattern)
+
+    if not weak_patterns:
+        weak_patterns = ["arrays", "strings", "trees"]
+    focus_patterns = weak_patterns[:5]
+
+    existing = await asyncio.to_thread(
+        _run_in_session, find_current_week_plan, req.userId, focus_patterns
+    )
+    if existing is not None:
         return {
-            "planId": plan.id,
-            "weekNumber": plan.week_number,
-            "focusPatterns": weak_patterns[:5],
-            "planMarkdown": plan_markdown,
+            "planId": existing.id,
+            "weekNumber": existing.week_number,
+            "focusPatterns": focus_patterns,
+            "planMarkdown": existing.plan_markdown,
         }
-    finally:
-        db.close()
+
+    mgr = await asyncio.to_thread(_get_memori_manager, req.userId, req.openaiKey)
+
+    # Generate plan using LLM
+    prompt = _STUDY_PLAN_PROMPT.format(
+        target_role=req.profile.target_role,
+        experience_level=req.profile.experience_level,
+        target_companies=", ".join(req.profile.target_companies) or "FAANG",
+        timeframe=req.profile.timeframe,
+        main_goal=req.profile.main_goal,
+        weak_patterns=", ".join(focus_patterns),
+        easy=difficulty_stats.get("Easy", {"total": 0, "correct": 0}),
+        medium=difficulty_stats.get("Medium", {"total": 0, "correct": 0}),
+        hard=difficulty_stats.get("Hard", {"total": 0, "correct": 0}),
+    )
+
+    messages = [
+        {
+            "role": "system",
+            "content": "You are an expert technical interview coach.",
+        },
+        {"role": "user", "content": prompt},
+    ]
+    # chat_completion builds the client lazily (Memori init, storage DDL) and
+    # serializes the call per manager, all on the worker thread.
+    response = await asyncio.to_thread(
+        mgr.chat_completion,
+        model=os.getenv("INTERVIEW_MODEL", "gpt-4o-mini"),
+        messages=messages,
+    )
+
+    plan_markdown = response.choices[0].message.content or ""
+
+    # Save the plan
+    plan = StudyPlan(
+        user_id=req.userId,
+        focus_patterns=focus_patterns,
+        daily_goal=3,
+        difficulty_focus="Medium",
+        plan_markdown=plan_markdown,
+    )
+    await asyncio.to_thread(_run_in_session, _add_and_commit, plan)
+
+    return {
+        "planId": plan.id,
+        "weekNumber": plan.week_number,
+        "focusPatterns": focus_patterns,
+        "planMarkdown": plan_markdown,
+    }
 
 
 @app.get("/study-plan/{user_id}")
-def get_study_plans(user_id: str) -> dict:
+def get_study_plans(user_id: str, db: Session = Depends(db_session)) -> dict:
     """Get study plans for a user."""
-    db = get_session()
-    try:
-        plans = (
-            db.query(StudyPlan)
-            .filter(StudyPlan.user_id == user_id)
-            .order_by(StudyPlan.created_at.desc())
-            .limit(5)
-            .all()
-        )
+    plans = (
+        db.query(StudyPlan)
+        .filter(StudyPlan.user_id == user_id)
+        .order_by(StudyPlan.created_at.desc())
+        .limit(5)
+        .all()
+    )
 
-        return {"plans": [p.to_dict() for p in plans]}
-    finally:
-        db.close()
+    return {"plans": [p.to_dict() for p in plans]}
 
 
 # ============================================
@@ -929,101 +1165,138 @@ def get_study_plans(user_id: str) -> dict:
 # ============================================
 
 
-@app.get("/export/{user_id}/markdown", response_class=PlainTextResponse)
-def export_markdown(user_id: str) -> str:
-    """Export practice history as Markdown."""
-    db = get_session()
-    try:
-        attempts = (
-            db.query(ProblemAttempt)
-            .filter(ProblemAttempt.user_id == user_id)
-            .order_by(ProblemAttempt.created_at.desc())
-            .all()
+# Upper bound on attempts listed in one Markdown export; override with
+# INTERVIEW_EXPORT_MAX_ATTEMPTS. Older attempts are reached with `before`.
+_EXPORT_MAX_ATTEMPTS = int(os.getenv("INTERVIEW_EXPORT_MAX_ATTEMPTS", "1000"))
+
+
+def _markdown_recent_rows(
+    db: Session, user_id: str, limit: int, before: datetime | None = None
+) -> Iterator[str]:
+    """Yield one Markdown section per recent attempt as rows are fetched."""
+    # Join each patterns array inside SQLite (JSON1) so rows arrive with the
+    # display string ready and nothing is JSON-decoded in Python.
+    pattern_values = func.json_each(ProblemAttempt.patterns).table_valued("value")
+    patterns_csv = (
+        select(func.group_concat(pattern_values.c.value, ", "))
+        .select_from(pattern_values)
+        .scalar_subquery()
+    )
+    query = db.query(
+        ProblemAttempt.title,
+        ProblemAttempt.difficulty,
+        func.coalesce(patterns_csv, "").label("patterns"),
+        ProblemAttempt.verdict,
+        ProblemAttempt.created_at,
+    ).filter(ProblemAttempt.user_id == user_id)
+    if before is not None:
+        query = query.filter(ProblemAttempt.created_at < before)
+    rows = (
+        query.order_by(ProblemAttempt.created_at.desc())
+        .limit(limit)
+        .execution_options(stream_results=True)
+        .yield_per(500)
+    )
+    for row in rows:
+        yield "".join(
+            (
+                f"### {row.title}\n\n",
+                f"- **Difficulty:** {row.difficulty}\n",
+                f"- **Patterns:** {row.patterns}\n",
+                f"- **Verdict:** {row.verdict}\n",
+                f"- **Date:** {row.created_at.strftime('%Y-%m-%d')}\n\n",
+            )
         )
 
-        pattern_stats = get_pattern_stats(db, user_id)
-        difficulty_stats = get_difficulty_stats(db, user_id)
 
-        # Build markdown
-        md = "# Interview Practice History\n\n"
-        md += f"**User:** {user_id}\n"
-        md += f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}\n\n"
+@app.get("/export/{user_id}/markdown", response_class=StreamingResponse)
+def export_markdown(
+    user_id: str,
+    limit: int = 20,
+    before: datetime | None = None,
+    db: Session = Depends(db_session),
+) -> StreamingResponse:
+    """
+    Export practice history as Markdown, streamed section by section.
+
+    Lists the `limit` most recent attempts (capped at _EXPORT_MAX_ATTEMPTS),
+    optionally only those created before `before` to page further back.
+    """
+    limit = max(0, min(limit, _EXPORT_MAX_ATTEMPTS))
+    total, correct = get_attempt_counts(db, user_id)
+    difficulty_stats = get_difficulty_stats(db, user_id)
+    top_patterns, _ = get_top_patterns(db, user_id, 10)
+
+    def generate() -> Iterator[str]:
+        parts: list[str] = []
+        parts.append("# Interview Practice History\n\n")
+        parts.append(f"**User:** {user_id}\n")
+        parts.append(
+            f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}\n\n"
+        )
 
         # Summary
-        md += "## Summary\n\n"
-        md += f"- **Total Problems:** {len(attempts)}\n"
-        correct = sum(1 for a in attempts if a.verdict == "correct")
-        md += f"- **Correct:** {correct} ({round(correct / len(attempts) * 100, 1) if attempts else 0}%)\n\n"
+        parts.append("## Summary\n\n")
+        parts.append(f"- **Total Problems:** {total}\n")
+        parts.append(
+            f"- **Correct:** {correct} ({round(correct / total * 100, 1) if total else 0}%)\n\n"
+        )
 
         # By difficulty
-        md += "### By Difficulty\n\n"
-        md += "| Difficulty | Solved | Correct |\n"
-        md += "|------------|--------|--------|\n"
+        parts.append("### By Difficulty\n\n")
+        parts.append("| Difficulty | Solved | Correct |\n")
+        parts.append("|------------|--------|--------|\n")
         for diff in ["Easy", "Medium", "Hard"]:
             stats = difficulty_stats.get(diff, {"total": 0, "correct": 0})
-            md += f"| {diff} | {stats['total']} | {stats['correct']} |\n"
+            parts.append(f"| {diff} | {stats['total']} | {stats['correct']} |\n")
 
         # By pattern
-        md += "\n### By Pattern\n\n"
-        md += "| Pattern | Total | Correct | Accuracy |\n"
-        md += "|---------|-------|---------|----------|\n"
-        for pattern, stats in sorted(
-            pattern_stats.items(), key=lambda x: x[1]["total"], reverse=True
-        )[:10]:
+        parts.append("\n### By Pattern\n\n")
+        parts.append("| Pattern | Total | Correct | Accuracy |\n")
+        parts.append("|---------|-------|---------|----------|\n")
+        for stats in top_patterns:
             acc = (
                 round(stats["correct"] / stats["total"] * 100, 1)
                 if stats["total"] > 0
                 else 0
             )
-            md += f"| {pattern} | {stats['total']} | {stats['correct']} | {acc}% |\n"
+            parts.append(
+                f"| {stats['pattern']} | {stats['total']} | {stats['correct']} | {acc}% |\n"
+            )
 
         # Recent problems
-        md += "\n## Recent Problems\n\n"
-        for attempt in attempts[:20]:
-            md += f"### {attempt.title}\n\n"
-            md += f"- **Difficulty:** {attempt.difficulty}\n"
-            md += f"- **Patterns:** {', '.join(json.loads(attempt.patterns) if attempt.patterns else [])}\n"
-            md += f"- **Verdict:** {attempt.verdict}\n"
-            md += f"- **Date:** {attempt.created_at.strftime('%Y-%m-%d')}\n\n"
-
-        return md
-    finally:
-        db.close()
+        parts.append("\n## Recent Problems\n\n")
+        yield "".join(parts)
+        # The request's Depends session may be closed before the body is
+        # streamed on older FastAPI, so the rows use a session of their own.
+        rows_db = get_session()
+        try:
+            yield from _markdown_recent_rows(rows_db, user_id, limit, before)
+        finally:
+            rows_db.close()
+
+    return StreamingResponse(generate(), media_type="text/markdown")
 
 
 @app.get("/export/{user_id}/resume-bullets")
-def export_resume_bullets(user_id: str) -> dict:
+def export_resume_bullets(user_id: str, db: Session = Depends(db_session)) -> dict:
     """Generate resume bullet points from practice history."""
-    db = get_session()
-    try:
-        attempts = (
-            db.query(ProblemAttempt).filter(ProblemAttempt.user_id == user_id).all()
+    total, correct = get_attempt_counts(db, user_id)
+    top_patterns, patterns_count = get_top_patterns(db, user_id, 3)
+
+    bullets = [
+        f"Solved {total}+ algorithmic coding challenges across {patterns_count} data structure and algorithm patterns",
+        f"Achieved {round(correct / total * 100) if total else 0}% success rate on technical interview problems",
+    ]
+
+    # Add pattern-specific bullets
+    if top_patterns:
+        pattern_names = [p["pattern"] for p in top_patterns]
+        bullets.append(
+            f"Demonstrated proficiency in {', '.join(pattern_names)} problem-solving techniques"
         )
 
-        pattern_stats = get_pattern_stats(db, user_id)
-
-        total = len(attempts)
-        correct = sum(1 for a in attempts if a.verdict == "correct")
-        patterns_count = len(pattern_stats)
-
-        bullets = [
-            f"Solved {total}+ algorithmic coding challenges across {patterns_count} data structure and algorithm patterns",
-            f"Achieved {round(correct / total * 100) if total else 0}% success rate on technical interview problems",
-        ]
-
-        # Add pattern-specific bullets
-        top_patterns = sorted(
-            pattern_stats.items(), key=lambda x: x[1]["total"], reverse=True
-        )[:3]
-        if top_patterns:
-            pattern_names = [p[0] for p in top_patterns]
-            bullets.append(
-                f"Demonstrated proficiency in {', '.join(pattern_names)} problem-solving techniques"
-            )
-
-        return {"bullets": bullets}
-    finally:
-        db.close()
+    return {"bullets": bullets}
 
 
 if __name__ == "__main__":
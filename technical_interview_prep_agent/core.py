@@ -1,3 +1,8 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
@@ -7,6 +12,60 @@ if TYPE_CHECKING:
     pass
 
 
+@lru_cache(maxsize=8)
+def _get_agent(
+    name: str, model_name: str, markdown: bool, temperature: float | None = None
+):
+    """Build each (name, model, temperature) Agno agent once and reuse it."""
+    # Lazy import heavy dependencies
+    from agno.agent import Agent
+    from agno.models.openai import OpenAIChat
+
+    return Agent(
+        name=name,
+        model=OpenAIChat(id=model_name, temperature=temperature),
+        markdown=markdown,
+    )
+
+
+# One line of the problem template, e.g. "Title: Two Sum".
+_TEMPLATE_LINE_RE = re.compile(
+    r"^[ \t]*(?P<key>Title|Difficulty|Patterns|Problem):(?P<value>.*)$",
+    re.MULTILINE,
+)
+
+# In-process LRU of LLM responses keyed by sha256(model + temperature + prompt).
+# Used for hints and evaluations, which run at temperature 0 so a cached answer
+# is what a retry would have produced anyway. Problem generation is never
+# cached: asking again is meant to produce a new problem.
+_RESPONSE_CACHE_MAXSIZE = 256
+_response_cache: OrderedDict[str, str] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Hints and evaluations are cached, so they must be deterministic.
+_CACHED_TEMPERATURE = 0.0
+
+
+def _response_cache_key(model_name: str, temperature: float, prompt: str) -> str:
+    return hashlib.sha256(f"{model_name}\0{temperature}\0{prompt}".encode()).hexdigest()
+
+
+def _get_cached_response(key: str) -> str | None:
+    with _response_cache_lock:
+        text = _response_cache.get(key)
+        if text is not None:
+            _response_cache.move_to_end(key)
+        return text
+
+
+def _put_cached_response(key: str, text: str) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = text
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_MAXSIZE:
+            _response_cache.popitem(last=False)
+
+
 class CandidateProfile(BaseModel):
     name: str = Field(..., description="Candidate's name or handle.")
     target_role: str = Field(
@@ -53,10 +112,6 @@ def generate_personalized_problem(
     Use an Agno Agent (OpenAIChat) to generate a single coding interview problem
     tailored to the candidate profile + requested difficulty/patterns.
     """
-    # Lazy import heavy dependencies
-    from agno.agent import Agent
-    from agno.models.openai import OpenAIChat
-
     # Build context strings
     patterns_str = ", ".join(patterns) if patterns else "mixed core data structures"
     weakness_block = weakness_context or ""
@@ -84,40 +139,28 @@ Problem:
 <full problem statement in Markdown>
 """
 
-    agent = Agent(
-        name="Interview Problem Generator",
-        model=OpenAIChat(id=model_name),
-        markdown=False,
-    )
+    agent = _get_agent("Interview Problem Generator", model_name, markdown=False)
     result = agent.run(prompt)
     text = str(getattr(result, "content", result))
 
-    # Simple parsing based on the enforced template.
-    title = "Practice Problem"
-    parsed_difficulty = difficulty
-    parsed_patterns: list[str] = patterns.copy()
-    statement_lines: list[str] = []
-    in_statement = False
-
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("Title:"):
-            title = stripped.split("Title:", 1)[1].strip() or title
-        elif stripped.startswith("Difficulty:"):
-            parsed_difficulty = stripped.split("Difficulty:", 1)[1].strip() or (
-                parsed_difficulty or difficulty
-            )
-        elif stripped.startswith("Patterns:"):
-            pats = stripped.split("Patterns:", 1)[1]
-            parsed_patterns = [p.strip() for p in pats.split(",") if p.strip()] or (
-                parsed_patterns or patterns
-            )
-        elif stripped.startswith("Problem:"):
-            in_statement = True
-        elif in_statement:
-            statement_lines.append(line)
-
-    statement = "\n".join(statement_lines).strip() or text
+    # Parse the enforced template: header lines up to "Problem:", then the
+    # statement is everything after that line.
+    fields: dict[str, str] = {}
+    statement = ""
+    for match in _TEMPLATE_LINE_RE.finditer(text):
+        key, value = match.group("key"), match.group("value").strip()
+        if key == "Problem":
+            statement = text[match.end() :].strip()
+            break
+        if value:
+            fields[key] = value
+
+    title = fields.get("Title", "Practice Problem")
+    parsed_difficulty = fields.get("Difficulty", difficulty)
+    parsed_patterns = [
+        p.strip() for p in fields.get("Patterns", "").split(",") if p.strip()
+    ] or patterns.copy()
+    statement = statement or text
 
     return ProblemMetadata(
         title=title,
@@ -137,10 +180,6 @@ def generate_hint(
     """
     Use Agno Agent to generate an incremental hint for the current attempt.
     """
-    # Lazy import heavy dependencies
-    from agno.agent import Agent
-    from agno.models.openai import OpenAIChat
-
     difficulty = problem.difficulty
     patterns_str = ", ".join(problem.patterns) or "general algorithms"
 
@@ -162,13 +201,21 @@ Provide a useful hint that:
 
 Respond with 1–3 short paragraphs of advice."""
 
-    agent = Agent(
-        name="Interview Hint Coach",
-        model=OpenAIChat(id=model_name),
+    cache_key = _response_cache_key(model_name, _CACHED_TEMPERATURE, prompt)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    agent = _get_agent(
+        "Interview Hint Coach",
+        model_name,
         markdown=True,
+        temperature=_CACHED_TEMPERATURE,
     )
     result = agent.run(prompt)
-    return str(getattr(result, "content", result))
+    text = str(getattr(result, "content", result))
+    _put_cached_response(cache_key, text)
+    return text
 
 
 def evaluate_solution(
@@ -186,10 +233,6 @@ def evaluate_solution(
     - Strengths and weaknesses
     - Recommended next focus
     """
-    # Lazy import heavy dependencies
-    from agno.agent import Agent
-    from agno.models.openai import OpenAIChat
-
     difficulty = problem.difficulty
     patterns_str = ", ".join(problem.patterns) or "general algorithms"
 
@@ -224,13 +267,21 @@ Short bullet list of the main issues, bugs, or missing edge cases.
 1–3 bullet points describing which algorithm/data-structure patterns or difficulty levels they should practice next, based on this attempt.
 """
 
-    agent = Agent(
-        name="Interview Solution Evaluator",
-        model=OpenAIChat(id=model_name),
+    cache_key = _response_cache_key(model_name, _CACHED_TEMPERATURE, prompt)
+    cached = _get_cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    agent = _get_agent(
+        "Interview Solution Evaluator",
+        model_name,
         markdown=True,
+        temperature=_CACHED_TEMPERATURE,
     )
     result = agent.run(prompt)
-    return str(getattr(result, "content", result))
+    text = str(getattr(result, "content", result))
+    _put_cached_response(cache_key, text)
+    return text
 
 
 def format_attempt_summary(
@@ -10,9 +10,12 @@ type Attempt = {
   createdAt: string;
   language: string;
   hintsUsed: number;
+  nextReviewAt: string | null;
+};
+
+type AttemptDetail = Attempt & {
   code: string;
   evaluationMarkdown: string;
-  nextReviewAt: string | null;
 };
 
 type Props = {
@@ -24,7 +27,7 @@ function HistoryTab({ apiBase, userId }: Props) {
   const [attempts, setAttempts] = useState<Attempt[]>([]);
   const [total, setTotal] = useState(0);
   const [loading, setLoading] = useState(false);
-  const [selectedAttempt, setSelectedAttempt] = useState<Attempt | null>(null);
+  const [selectedAttempt, setSelectedAttempt] = useState<AttemptDetail | null>(null);
 
   // Filters
   const [difficulty, setDifficulty] = useState<string>("");
@@ -69,6 +72,17 @@ function HistoryTab({ apiBase, userId }: Props) {
     return "verdict-partial";
   };
 
+  const handleView = async (attemptId: number) => {
+    try {
+      const res = await fetch(`${apiBase}/attempts/${attemptId}`);
+      if (res.ok) {
+        setSelectedAttempt(await res.json());
+      }
+    } catch (e) {
+      console.error(e);
+    }
+  };
+
   const handleBookmark = async (attemptId: number) => {
     try {
       await fetch(`${apiBase}/bookmarks/add`, {
@@ -156,7 +170,7 @@ function HistoryTab({ apiBase, userId }: Props) {
                   </div>
                 </div>
                 <div className="history-actions">
-                  <button className="btn-small" onClick={() => setSelectedAttempt(attempt)}>
+                  <button className="btn-small" onClick={() => handleView(attempt.id)}>
                     View
                   </button>
                   <button className="btn-small" onClick={() => handleBookmark(attempt.id)}>
@@ -1,16 +1,222 @@
-import json
+import atexit
+import inspect
+import logging
 import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+import pydantic_core
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Lazy imports to reduce memory at startup
 if TYPE_CHECKING:
-    pass
+    from memori import Memori
+    from openai import OpenAI
+
+# Concurrent Memori writes per log_problem_attempts_batch call.
+_BATCH_MAX_WORKERS = 8
+
+# How long get_latest_candidate_profile trusts its last recalled profile.
+_PROFILE_CACHE_TTL_SECONDS = 60
+
+# Per-manager LRU of summarize_performance answers.
+_SUMMARY_CACHE_MAXSIZE = 64
+_SUMMARY_CACHE_TTL_SECONDS = 300
+
+# Applied to every new SQLite connection: WAL + synchronous=NORMAL turns the
+# free-usage upserts into appends without a full fsync per commit.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=134217728",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _keyword_params(fn: Any) -> frozenset[str]:
+    """Names fn accepts as keyword arguments; empty if it can't be inspected."""
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return frozenset()
+    return frozenset(
+        p.name for p in params if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+    )
+
+
+# Timestamp fields a recall hit may carry, in order of preference.
+_RECALL_TIMESTAMP_KEYS = ("created_at", "date_created", "timestamp")
+
+
+def _newest_first(results: list[Any]) -> list[Any]:
+    """
+    Order recall hits newest first when they all carry a comparable
+    timestamp; otherwise keep Memori's own order.
+    """
+    for key in _RECALL_TIMESTAMP_KEYS:
+        if results and all(isinstance(r, dict) and r.get(key) for r in results):
+            try:
+                return sorted(results, key=lambda r: r[key], reverse=True)
+            except TypeError:
+                break
+    return results
+
+
+# Free-usage quota SQL, parsed once at import rather than on every call.
+_SELECT_ONE = text("SELECT 1")
+
+_CREATE_FREE_USAGE = text(
+    """
+    CREATE TABLE IF NOT EXISTS interview_free_usage (
+        entity_id TEXT PRIMARY KEY,
+        remaining INTEGER NOT NULL
+    )
+    """
+)
+
+_UPSERT_FREE_USAGE = text(
+    """
+    INSERT INTO interview_free_usage (entity_id, remaining)
+    VALUES (:entity_id, :remaining)
+    ON CONFLICT(entity_id) DO UPDATE SET remaining = excluded.remaining
+    """
+)
+
+_SELECT_FREE_USAGE = text(
+    "SELECT remaining FROM interview_free_usage WHERE entity_id = :entity_id"
+)
+
+_DECREMENT_FREE_USAGE = text(
+    """
+    INSERT INTO interview_free_usage (entity_id, remaining)
+    VALUES (:entity_id, MAX(:default_total - 1, 0))
+    ON CONFLICT(entity_id) DO UPDATE
+    SET remaining = MAX(interview_free_usage.remaining - 1, 0)
+    RETURNING remaining
+    """
+)
+
+# Latest profile per entity, so lookups are a primary-key read instead of a
+# Memori recall plus a scan of the hits.
+_CREATE_PROFILES = text(
+    """
+    CREATE TABLE IF NOT EXISTS interview_profiles (
+        entity_id TEXT PRIMARY KEY,
+        profile TEXT NOT NULL
+    )
+    """
+)
+
+_UPSERT_PROFILE = text(
+    """
+    INSERT INTO interview_profiles (entity_id, profile)
+    VALUES (:entity_id, :profile)
+    ON CONFLICT(entity_id) DO UPDATE SET profile = excluded.profile
+    """
+)
+
+_SELECT_PROFILE = text(
+    "SELECT profile FROM interview_profiles WHERE entity_id = :entity_id"
+)
+
+# SQLite files whose helper tables have been ensured in this process.
+_BOOTSTRAPPED_PATHS: set[str] = set()
+
+
+@lru_cache(maxsize=8)
+def _get_engine(db_path: str):
+    """
+    One engine per SQLite file, shared by every MemoriManager that uses it,
+    so new managers reuse warm pooled connections (and SQLite's page cache)
+    instead of opening their own.
+    """
+    # A few long-lived connections for all managers on this file, with
+    # overflow for bursts of concurrent Memori writes.
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        poolclass=QueuePool,
+        pool_size=4,
+        max_overflow=8,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+        connect_args={"check_same_thread": False},
+    )
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+@lru_cache(maxsize=8)
+def _get_sessionmaker(db_path: str) -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=_get_engine(db_path))
+
+
+class _AttemptWorker:
+    """
+    Single daemon thread that drains fire-and-forget Memori writes, so the
+    caller doesn't wait on the LLM/storage round trip. When the queue is full
+    the write is dropped and logged. The queue is drained at interpreter exit.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((fn, args))
+        except queue.Full:
+            # Never block the caller (it may be the event loop): shed the write.
+            logger.warning("Memori write queue full; dropping attempt write")
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(
+                    target=self._run, name="memori-attempt-writer", daemon=True
+                )
+                thread.start()
+                atexit.register(self._queue.join)
+                self._thread = thread
+
+    def _run(self) -> None:
+        while True:
+            fn, args = self._queue.get()
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("Background Memori write failed")
+            finally:
+                self._queue.task_done()
+
+
+_attempt_worker = _AttemptWorker()
 
 
 class MemoriManager:
@@ -28,10 +234,6 @@ class MemoriManager:
         entity_id: str = "interview-prep-user",
         process_id: str = "interview-prep",
     ) -> None:
-        # Lazy import heavy dependencies to reduce memory at startup
-        from memori import Memori
-        from openai import OpenAI
-
         # Resolve OpenAI key
         openai_key = openai_api_key or os.getenv("OPENAI_API_KEY", "")
         if not openai_key:
@@ -44,47 +246,122 @@ class MemoriManager:
             or os.getenv("SQLITE_DB_PATH")
             or "./memori_interview.sqlite"
         )
-        database_url = f"sqlite:///{db_path}"
+        engine = _get_engine(db_path)
+
+        # Optional connectivity check + ensure our own helper tables exist.
+        # Done once per DB file per process, not on every construction.
+        if db_path not in _BOOTSTRAPPED_PATHS:
+            with engine.connect() as conn:
+                conn.execute(_SELECT_ONE)
+                conn.execute(_CREATE_FREE_USAGE)
+                conn.execute(_CREATE_PROFILES)
+            _BOOTSTRAPPED_PATHS.add(db_path)
+
+        self.SessionLocal: sessionmaker = _get_sessionmaker(db_path)
+
+        # Memori and the OpenAI client are built on first use (see memori /
+        # openai_client), so quota reads never pay for them.
+        self._openai_key = openai_key
+        self._process_id = process_id
+        self._memori: Memori | None = None
+        self._openai_client: OpenAI | None = None
+        self._memori_lock = threading.Lock()
+        self._adapter_commit: Callable[[], Any] | None = None
+        self._memori_write: Callable[..., Any] | None = None
+        # One manager is shared by concurrent requests and the attempt worker.
+        # Memori keeps per-instance state it updates without locking (cached
+        # session/conversation ids, the storage adapter's session), so every
+        # call into it, or through the client it wraps, holds this lock.
+        self._memori_call_lock = threading.Lock()
 
-        engine = create_engine(
-            database_url,
-            pool_pre_ping=True,
-            connect_args={"check_same_thread": False},
-        )
-
-        # Optional connectivity check + ensure our own helper table exists.
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-            conn.execute(
-                text(
-                    """
-                    CREATE TABLE IF NOT EXISTS interview_free_usage (
-                        entity_id TEXT PRIMARY KEY,
-                        remaining INTEGER NOT NULL
-                    )
-                    """
-                )
-            )
-
-        self.SessionLocal: sessionmaker = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=engine,
-        )
-
-        client = OpenAI(api_key=openai_key)
-        mem = Memori(conn=self.SessionLocal).openai.register(client)
-        mem.attribution(entity_id=entity_id, process_id=process_id)
-        mem.config.storage.build()
-
-        self.memori: Memori = mem
-        self.openai_client: OpenAI = client
         self.sqlite_path = db_path
-        self.entity_id = entity_id
+        # Always non-empty, so the free-usage helpers can key on it directly.
+        self.entity_id = entity_id or "interview-prep-user"
+        # (monotonic timestamp, profile); written through by log_candidate_profile.
+        self._profile_cache: tuple[float, dict[str, Any]] | None = None
+        # (entity_id, normalized question) -> (monotonic timestamp, answer)
+        self._summary_cache: OrderedDict[tuple[str, str], tuple[float, str]] = (
+            OrderedDict()
+        )
+        self._summary_cache_lock = threading.Lock()
+
+    def _init_memori(self) -> None:
+        """Import Memori/OpenAI and register the client with Memori, once."""
+        with self._memori_lock:
+            if self._memori is not None:
+                return
+
+            # Lazy import heavy dependencies to reduce memory at startup
+            from memori import Memori
+            from openai import OpenAI
+
+            client = OpenAI(api_key=self._openai_key)
+            mem = Memori(conn=self.SessionLocal).openai.register(client)
+            mem.attribution(entity_id=self.entity_id, process_id=self._process_id)
+            mem.config.storage.build()
+
+            # Resolve the storage adapter's commit once, not on every write.
+            adapter = getattr(mem.config.storage, "adapter", None)
+            commit = getattr(adapter, "commit", None)
+            self._adapter_commit = commit if callable(commit) else None
+
+            # Memori 3.x has no local direct-write API (capture_agent_turn is
+            # Cloud-only): it captures calls made through the registered
+            # client, so that is the one write path.
+            self._memori_write = client.chat.completions.create
+
+            self._openai_client = client
+            self._memori = mem
+
+    @property
+    def memori(self) -> "Memori":
+        if self._memori is None:
+            self._init_memori()
+        return self._memori  # type: ignore[return-value]
+
+    @property
+    def openai_client(self) -> "OpenAI":
+        # Built together with Memori: the client must be registered before use
+        # so Memori captures and augments its calls.
+        if self._memori is None:
+            self._init_memori()
+        return self._openai_client  # type: ignore[return-value]
+
+    def chat_completion(self, **kwargs: Any) -> Any:
+        """Run a chat completion through the Memori-registered client."""
+        client = self.openai_client
+        with self._memori_call_lock:
+            return client.chat.completions.create(**kwargs)
 
     def get_db(self) -> Session:
         return self.SessionLocal()
 
+    def _commit_storage(self) -> None:
+        """Best-effort explicit commit of Memori's storage adapter."""
+        if self._adapter_commit is None:
+            return
+        try:
+            with self._memori_call_lock:
+                self._adapter_commit()
+        except Exception:
+            # Non-fatal; Memori should still persist in most configurations.
+            pass
+
+    def _remember(self, messages: list[dict[str, str]], model: str) -> None:
+        """
+        Hand messages to Memori for ingestion via the write path bound in
+        _init_memori. Failures are logged and re-raised; there is no second
+        path, so a partly persisted write is never repeated.
+        """
+        if self._memori_write is None:
+            self._init_memori()
+        try:
+            with self._memori_call_lock:
+                self._memori_write(model=model, messages=messages)
+        except Exception:
+            logger.exception("Memori write failed for entity %s", self.entity_id)
+            raise
+
     # ---- High-level helpers for the Interview Prep demo ----
 
     def log_candidate_profile(self, profile_data: dict[str, Any]) -> None:
@@ -92,19 +369,18 @@ class MemoriManager:
         Store a structured candidate profile in Memori via a tagged JSON payload.
 
         The tag `INTERVIEW_PROFILE` is used so we can later search specifically
-        for profile documents.
+        for profile documents. The profile is also kept in the local
+        interview_profiles table for direct lookup.
         """
         payload = {
             "type": "interview_profile",
             "version": 1,
             "profile": profile_data,
         }
-        tagged_text = "INTERVIEW_PROFILE " + json.dumps(payload, ensure_ascii=False)
+        tagged_text = "INTERVIEW_PROFILE " + pydantic_core.to_json(payload).decode()
 
-        # Send via the registered OpenAI client so Memori can capture it.
-        self.openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
+        self._remember(
+            [
                 {
                     "role": "user",
                     "content": (
@@ -114,16 +390,23 @@ class MemoriManager:
                     ),
                 },
             ],
+            model="gpt-4o-mini",
         )
 
-        # Best-effort explicit commit
-        try:
-            adapter = getattr(self.memori.config.storage, "adapter", None)
-            if adapter is not None and hasattr(adapter, "commit"):
-                adapter.commit()
-        except Exception:
-            # Non-fatal; Memori should still persist in most configurations.
-            pass
+        self._commit_storage()
+
+        with self.get_db() as db:
+            db.execute(
+                _UPSERT_PROFILE,
+                {
+                    "entity_id": self.entity_id,
+                    "profile": pydantic_core.to_json(profile_data).decode(),
+                },
+            )
+            db.commit()
+
+        self._profile_cache = (time.monotonic(), profile_data)
+        self._clear_summary_cache()
 
     def log_problem_attempt(self, attempt_summary: str) -> None:
         """
@@ -133,31 +416,59 @@ class MemoriManager:
         - Problem difficulty and patterns.
         - Whether the attempt was successful.
         - Hints used, main bugs, and recommended follow-ups.
+
+        Fire-and-forget: the write is queued for a background worker thread
+        and this returns immediately without blocking. Failures, and writes
+        dropped because the queue is full, are logged, not raised.
         """
+        _attempt_worker.submit(self._store_problem_attempt, attempt_summary)
+
+    def _store_problem_attempt(self, attempt_summary: str) -> None:
+        """Synchronously hand one attempt summary to Memori."""
         system_prompt = (
             "The following text describes one coding interview practice attempt for "
             "this candidate (problem metadata, their solution, hints, and evaluation). "
             "Extract and remember algorithm/data-structure patterns, difficulty level, "
             "common mistakes, and any signs of improvement or regression."
         )
-        self.openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
+        self._remember(
+            [
                 {"role": "system", "content": system_prompt},
                 {
                     "role": "user",
                     "content": attempt_summary,
                 },
             ],
+            model="gpt-4o-mini",
         )
 
-        # Best-effort explicit commit
-        try:
-            adapter = getattr(self.memori.config.storage, "adapter", None)
-            if adapter is not None and hasattr(adapter, "commit"):
-                adapter.commit()
-        except Exception:
-            pass
+        self._commit_storage()
+        self._clear_summary_cache()
+
+    def log_problem_attempts_batch(
+        self, attempt_summaries: list[str]
+    ) -> list[Exception | None]:
+        """
+        Store several attempt summaries at once and wait for the result.
+
+        The writes are I/O-bound, so they run concurrently on a small thread
+        pool instead of paying each round trip in turn. Returns one entry per
+        summary, in order: None on success, or the exception that item raised,
+        so one failure doesn't drop the rest of the batch.
+        """
+        if not attempt_summaries:
+            return []
+
+        def log_one(summary: str) -> Exception | None:
+            try:
+                self._store_problem_attempt(summary)
+            except Exception as e:
+                return e
+            return None
+
+        workers = min(_BATCH_MAX_WORKERS, len(attempt_summaries))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(log_one, attempt_summaries))
 
     def summarize_performance(self, question: str) -> str:
         """
@@ -166,7 +477,33 @@ class MemoriManager:
         Example questions:
         - "What algorithm patterns am I weakest at?"
         - "How have I improved over the last 10 attempts?"
+
+        Answers are cached per normalized question for
+        _SUMMARY_CACHE_TTL_SECONDS; logging new memories clears the cache.
         """
+        return "".join(self.summarize_performance_stream(question))
+
+    def summarize_performance_stream(self, question: str) -> Iterator[str]:
+        """
+        Like summarize_performance, but yield the answer as it is generated so
+        a UI can render the first tokens without waiting for the whole reply.
+
+        A cached answer is yielded as a single chunk. A fully streamed answer
+        is cached; an abandoned stream is not.
+        """
+        key = (self.entity_id, " ".join(question.lower().split()))
+        now = time.monotonic()
+        answer: str | None = None
+        with self._summary_cache_lock:
+            cached = self._summary_cache.get(key)
+            if cached is not None and now - cached[0] < _SUMMARY_CACHE_TTL_SECONDS:
+                self._summary_cache.move_to_end(key)
+                answer = cached[1]
+        # Yield outside the lock: a suspended generator must not hold it.
+        if answer is not None:
+            yield answer
+            return
+
         system_prompt = (
             "You are an AI technical interview coach with long-term memory about the "
             "candidate's past coding interview practice attempts and profile. "
@@ -175,33 +512,71 @@ class MemoriManager:
             "- Difficulty bands (easy/medium/hard) they handle well or poorly.\n"
             "- Trends over time and specific, actionable next steps."
         )
-        response = self.openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": question},
-            ],
-        )
-        return response.choices[0].message.content or ""
+        client = self.openai_client
+        with self._memori_call_lock:
+            stream = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": question},
+                ],
+                stream=True,
+            )
+        parts: list[str] = []
+        chunks = iter(stream)
+        while True:
+            # Memori captures the exchange as the stream is consumed, so each
+            # read is serialized too; the lock is released before yielding.
+            with self._memori_call_lock:
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield delta
+
+        with self._summary_cache_lock:
+            self._summary_cache[key] = (now, "".join(parts))
+            self._summary_cache.move_to_end(key)
+            while len(self._summary_cache) > _SUMMARY_CACHE_MAXSIZE:
+                self._summary_cache.popitem(last=False)
+
+    def _clear_summary_cache(self) -> None:
+        with self._summary_cache_lock:
+            self._summary_cache.clear()
 
     def set_free_uses_remaining(self, remaining: int) -> None:
         """
         Persist the remaining free-usage quota for the current entity/process
         in a small SQLite table (separate from Memori's own schema).
         """
-        if not getattr(self, "entity_id", None):
+        with self.get_db() as db:
+            db.execute(
+                _UPSERT_FREE_USAGE,
+                {"entity_id": self.entity_id, "remaining": int(remaining)},
+            )
+            db.commit()
+
+    def set_free_uses_remaining_many(self, items: list[tuple[str, int]]) -> None:
+        """
+        Persist remaining free-usage quotas for several entities at once.
+
+        `items` is a list of (entity_id, remaining) pairs; all rows are upserted
+        with one executemany in a single transaction (one commit, one fsync).
+        """
+        if not items:
             return
 
         with self.get_db() as db:
             db.execute(
-                text(
-                    """
-                    INSERT INTO interview_free_usage (entity_id, remaining)
-                    VALUES (:entity_id, :remaining)
-                    ON CONFLICT(entity_id) DO UPDATE SET remaining = :remaining
-                    """
-                ),
-                {"entity_id": self.entity_id, "remaining": int(remaining)},
+                _UPSERT_FREE_USAGE,
+                [
+                    {"entity_id": entity_id, "remaining": int(remaining)}
+                    for entity_id, remaining in items
+                ],
             )
             db.commit()
 
@@ -210,14 +585,9 @@ class MemoriManager:
         Retrieve the remaining free-usage quota for the current entity/process
         from the local SQLite helper table.
         """
-        if not getattr(self, "entity_id", None):
-            return default_total
-
         with self.get_db() as db:
             row = db.execute(
-                text(
-                    "SELECT remaining FROM interview_free_usage WHERE entity_id = :entity_id"
-                ),
+                _SELECT_FREE_USAGE,
                 {"entity_id": self.entity_id},
             ).fetchone()
 
@@ -229,38 +599,105 @@ class MemoriManager:
         except (TypeError, ValueError):
             return default_total
 
+    def decrement_free_uses_remaining(self, default_total: int = 6) -> int:
+        """
+        Use up one free use for the current entity and return what is left.
+
+        A single upsert ... RETURNING does the read-modify-write atomically, so
+        concurrent requests can't both spend the same use. An entity without a
+        row starts from default_total; the count never drops below zero.
+        """
+        with self.get_db() as db:
+            remaining = db.execute(
+                _DECREMENT_FREE_USAGE,
+                {"entity_id": self.entity_id, "default_total": int(default_total)},
+            ).scalar_one()
+            db.commit()
+
+        return int(remaining)
+
     def get_latest_candidate_profile(self) -> dict[str, Any] | None:
         """
         Attempt to retrieve the most recently stored candidate profile from Memori.
 
-        Uses Memori's recall API, which respects the current attribution
-        (entity_id / process_id / session) so profiles remain isolated per
-        logical "user" in a multi-tenant app.
+        Reads the local interview_profiles table first. Profiles stored before
+        that table existed are found through Memori's recall API, which
+        respects the current attribution (entity_id / process_id / session) so
+        profiles remain isolated per logical "user" in a multi-tenant app. A
+        found profile is cached on the instance for _PROFILE_CACHE_TTL_SECONDS.
         """
+        cached = self._profile_cache
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < _PROFILE_CACHE_TTL_SECONDS
+        ):
+            return cached[1]
+
+        with self.get_db() as db:
+            stored = db.execute(
+                _SELECT_PROFILE, {"entity_id": self.entity_id}
+            ).scalar_one_or_none()
+        if stored is not None:
+            try:
+                profile = pydantic_core.from_json(stored)
+            except ValueError:
+                profile = None
+            if isinstance(profile, dict):
+                self._profile_cache = (time.monotonic(), profile)
+                return profile
+
         recall_fn = getattr(self.memori, "recall", None)
         if recall_fn is None:
             return None
 
-        try:
-            results: list[Any] = (
-                recall_fn("INTERVIEW_PROFILE", limit=5) or []  # type: ignore[call-arg]
-            )
-        except Exception:
-            return None
+        results: list[Any] | None = None
+        params = _keyword_params(recall_fn)
+        if {"order", "tag"} <= params:
+            # Ordered, tag-filtered recall: the single newest match is all we
+            # need. Without a tag filter the top hit may not be a profile.
+            try:
+                with self._memori_call_lock:
+                    results = recall_fn(
+                        "INTERVIEW_PROFILE",
+                        limit=1,
+                        order="recency_desc",
+                        tag="INTERVIEW_PROFILE",
+                    )
+            except Exception:
+                results = None
+        if not results:
+            try:
+                with self._memori_call_lock:
+                    results = (
+                        recall_fn("INTERVIEW_PROFILE", limit=5) or []  # type: ignore[call-arg]
+                    )
+            except Exception:
+                return None
 
-        for r in results:
+        seen: set[str] = set()
+        # Newest first, so the loop below stops at the latest profile.
+        for r in _newest_first(results):
             # mem.recall typically returns dicts with a 'content' field
             if isinstance(r, dict):
                 text = str(r.get("content") or "")
             else:
                 text = str(r)
 
+            # Cheap substring check before slicing and parsing: hits that
+            # aren't profile documents never reach the JSON parser.
+            if "interview_profile" not in text:
+                continue
             idx = text.find("{")
             jdx = text.rfind("}")
             if idx == -1 or jdx == -1:
                 continue
+            # Re-logged profiles come back as identical copies; parse each once.
+            payload = text[idx : jdx + 1]
+            if payload in seen:
+                continue
+            seen.add(payload)
             try:
-                obj = json.loads(text[idx : jdx + 1])
+                obj = pydantic_core.from_json(payload)
             except Exception:
                 continue
 
@@ -270,6 +707,7 @@ class MemoriManager:
                 continue
             profile = obj.get("profile")
             if isinstance(profile, dict):
+                self._profile_cache = (time.monotonic(), profile)
                 return profile
 
         return None